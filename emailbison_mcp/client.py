@@ -2,17 +2,414 @@ from __future__ import annotations
 
 # Lightweight EmailBison REST client helpers.
 
+import asyncio
+import gzip
+import io
 import json
-from typing import Any, Dict, Iterable, Mapping, Optional
+import random
+import weakref
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import chain
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Iterable, Mapping, Optional
 
 import httpx
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import h2  # noqa: F401  # required by httpx for HTTP/2 support
+except ImportError:  # pragma: no cover - HTTP/2 is an optional speedup
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
+# Connection pool sizing shared by every EmailBisonClient. Idle connections are
+# kept well past httpx's 5 s default because tool calls arrive at the pace of
+# model turns; a shorter expiry would pay a fresh TLS handshake on most calls.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=100,
+    max_connections=1000,
+    keepalive_expiry=60.0,
+)
+
+# Transport-level retries; httpx only retries failed connection attempts, so
+# requests that reached the API are never replayed.
+_CONNECT_RETRIES = 2
+
+# Responses that are retried inside ``request``: 429 for every method (the API
+# rejected the call without acting on it) and gateway errors for GETs only.
+_RETRY_ATTEMPTS = 3
+_RETRY_STATUS_ANY_METHOD = frozenset({429})
+_RETRY_STATUS_GET = frozenset({502, 503, 504})
+# Upper bound in seconds for a single wait, whether from Retry-After or backoff.
+_RETRY_MAX_DELAY = 30.0
+
+# Default cap on concurrent requests per client, so fan-outs such as parallel
+# pagination queue locally instead of tripping the API's rate limit.
+_REQUEST_CONCURRENCY = 8
+
+# Pooled httpx clients per event loop, keyed by (api_key, base_url), so that
+# repeated EmailBisonClient instances for the same account reuse one TCP/TLS
+# pool. httpx connections are bound to the loop that opened them; entries for a
+# loop disappear once that loop is garbage collected.
+_SHARED_HTTP_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+# Static endpoint paths shared by the request methods below.
+_EP_REPLIES = "/replies"
+_EP_REPLIES_NEW = "/replies/new"
+_EP_SENDER_EMAILS = "/sender-emails"
+_EP_WARMUP_SENDER_EMAILS = "/warmup/sender-emails"
+_EP_WARMUP_ENABLE = "/warmup/sender-emails/enable"
+_EP_WARMUP_DISABLE = "/warmup/sender-emails/disable"
+_EP_WARMUP_DAILY_LIMITS = "/warmup/sender-emails/update-daily-warmup-limits"
+_EP_WORKSPACES = "/workspaces/v1.1"
+_EP_WORKSPACES_SWITCH = "/workspaces/v1.1/switch-workspace"
+_EP_WORKSPACES_INVITE = "/workspaces/v1.1/invite-members"
+_EP_WORKSPACES_STATS = "/workspaces/v1.1/stats"
+_EP_WORKSPACES_CHART_STATS = "/workspaces/v1.1/line-area-chart-stats"
+
+# Per-request headers for JSON bodies.
+_JSON_REQUEST_HEADERS: Mapping[str, str] = {"Content-Type": "application/json"}
+
+# Content-Type prefixes whose bodies are decoded as JSON.
+_JSON_CONTENT_TYPES = ("application/json", "application/problem+json", "application/vnd.api+json")
+
+# Maximum number of entity IDs sent per tag attach/remove request.
+_TAG_BATCH_SIZE = 500
+
+# JSON bodies above this size are gzip-compressed when compress_requests is on.
+_GZIP_MIN_BYTES = 2048
+
+# Upper bound on ETag-validated GET responses remembered per client.
+_ETAG_CACHE_MAXSIZE = 256
+
+# Maximum number of page requests in flight when auto-paginating.
+_PAGINATION_CONCURRENCY = 8
+
+# While a warmup request is in flight, further toggles issued within this window
+# (seconds) are merged into one follow-up request.
+_WARMUP_COALESCE_WINDOW = 0.010
+
+
+# Reused by the stdlib fallback; json.dumps builds a new encoder per call when
+# given non-default arguments.
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _dumps(data: Any, *, non_str_keys: bool = False) -> bytes:
+    """Serialize a request body to JSON bytes, preferring orjson when available.
+
+    ``non_str_keys`` lets orjson accept int/float dict keys the way stdlib json does.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS if non_str_keys else None)
+    return _COMPACT_JSON_ENCODER.encode(data).encode("utf-8")
+
+
+def _loads(data: bytes | str) -> Any:
+    """Parse a JSON response body, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _to_camel(snake_key: str) -> str:
+    """Convert a snake_case query key to camelCase (keys come from a small, fixed vocabulary)."""
+    parts = snake_key.split("_")
+    return parts[0] + "".join(part.capitalize() for part in parts[1:]) if parts else snake_key
+
+
+def _serialize_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _join_csv(value: Iterable[Any]) -> str:
+    return ",".join(map(str, value))
+
+
+def _as_list(values: Iterable[Any]) -> list[Any]:
+    """Return ``values`` unchanged if it is already a list, otherwise a new list."""
+    return values if type(values) is list else list(values)
+
+
+def _as_int_list(values: Iterable[Any]) -> list[int]:
+    """Coerce an iterable of IDs to ints, casting in C when every item is already an int."""
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    try:
+        return array("q", values).tolist()
+    except (TypeError, OverflowError):
+        # Fall back for numeric strings (e.g. "42") that array() rejects.
+        return [int(value) for value in values]
+
+
+# Query-string serializers keyed by exact value type; other types pass through.
+_PARAM_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    bool: _serialize_bool,
+    list: _join_csv,
+    tuple: _join_csv,
+    set: _join_csv,
+}
+
+
+def _pack(items: Iterable[tuple[str, Any]]) -> Dict[str, Any]:
+    """Build a request body/query dict from (key, value) pairs, skipping ``None`` values."""
+    return {key: value for key, value in items if value is not None}
+
+
+@lru_cache(maxsize=4096)
+def _path(template: str, resource_id: int | str) -> str:
+    """Fill a ``{}`` path template with a resource ID, reusing strings for repeated IDs."""
+    return template.format(resource_id)
+
+
+@lru_cache(maxsize=4096)
+def _campaign_path(campaign_id: int | str, suffix: str = "") -> str:
+    """Return the ``/campaigns/{id}`` path for a campaign sub-resource."""
+    return "/campaigns/" + str(campaign_id) + suffix
+
+
+def _prepare_query(
+    base: Mapping[str, Any],
+    extra_filters: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build camelCase query parameters from snake_case arguments, dropping empty values."""
+    params: Dict[str, Any] = {}
+    items = chain(base.items(), extra_filters.items() if extra_filters else ())
+    for key, value in items:
+        if value is None or value == "":
+            continue
+        key = str(key)
+        # Preserve dot notation (e.g., "filters.lead_campaign_status")
+        if "." in key:
+            # For filter keys with dot notation, pass arrays as-is (httpx will repeat them)
+            if isinstance(value, (list, tuple, set)):
+                params[key] = _as_list(value)
+                continue
+            param_key = key
+        else:
+            param_key = _to_camel(key)
+        serialize = _PARAM_SERIALIZERS.get(type(value))
+        params[param_key] = serialize(value) if serialize else value
+    return params
+
+
+def _last_page(payload: Any, per_page: int) -> int:
+    """Return the last page number advertised by a paginated payload (at least 1)."""
+    if not isinstance(payload, Mapping):
+        return 1
+    meta = payload.get("meta") or {}
+    last_page = meta.get("last_page")
+    if last_page:
+        return int(last_page)
+    total = meta.get("total") or payload.get("total") or 0
+    # The API may serve fewer rows per page than requested; trust its own figure.
+    per_page = int(meta.get("per_page") or per_page)
+    if total and per_page > 0:
+        return (int(total) + per_page - 1) // per_page
+    return 1
+
+
+async def gather_pages(
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+    *,
+    per_page: int,
+    max_concurrency: int = _PAGINATION_CONCURRENCY,
+) -> dict[str, Any]:
+    """Fetch every page of a paginated endpoint and merge their ``data`` rows.
+
+    Page 1 is fetched first to learn ``meta.last_page``; the remaining pages are
+    requested concurrently with at most ``max_concurrency`` in flight. The result
+    is page 1's payload with ``data`` holding the rows of all pages in page order,
+    ``links`` dropped and ``meta`` describing the combined result as a final page.
+    """
+    first = await fetch_page(1)
+    last_page = _last_page(first, per_page)
+    if last_page <= 1:
+        return first
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(page: int) -> dict[str, Any]:
+        async with semaphore:
+            return await fetch_page(page)
+
+    rest = await asyncio.gather(*(fetch(page) for page in range(2, last_page + 1)))
+    rows = list(first.get("data") or ())
+    for payload in rest:
+        rows.extend(payload.get("data") or ())
+
+    merged = {key: value for key, value in first.items() if key != "links"}
+    merged["data"] = rows
+    merged["meta"] = {
+        **(first.get("meta") or {}),
+        "current_page": last_page,
+        "last_page": last_page,
+        "from": 1 if rows else None,
+        "to": len(rows),
+    }
+    return merged
+
+
+async def iter_pages(
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+    *,
+    per_page: int,
+    max_concurrency: int = _PAGINATION_CONCURRENCY,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield every page of a paginated endpoint, fetching pages after the first concurrently.
+
+    Page 1 is fetched first to learn ``meta.last_page``; the remaining pages are
+    requested with at most ``max_concurrency`` in flight and yielded in
+    completion order, not page order; use ``meta.current_page`` to place a page.
+    Only pages the consumer has not yet taken are held in memory. Closing the
+    generator cancels the outstanding requests and waits for them to finish.
+    """
+    first = await fetch_page(1)
+    yield first
+    last_page = _last_page(first, per_page)
+    if last_page <= 1:
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(page: int) -> dict[str, Any]:
+        async with semaphore:
+            return await fetch_page(page)
+
+    tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, last_page + 1)]
+    try:
+        for next_page in asyncio.as_completed(tasks):
+            yield await next_page
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Also retrieves errors of finished pages the consumer never took
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying ``response``.
+
+    Honours ``Retry-After`` (delta-seconds or HTTP date) when present, otherwise
+    uses exponential backoff with jitter. Both are capped at ``_RETRY_MAX_DELAY``.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                delay = None
+            else:
+                if when.tzinfo is None:
+                    when = when.replace(tzinfo=timezone.utc)
+                delay = (when - datetime.now(timezone.utc)).total_seconds()
+        if delay is not None:
+            return min(max(delay, 0.0), _RETRY_MAX_DELAY)
+    return min(2**attempt + random.random(), _RETRY_MAX_DELAY)
+
 
 class EmailBisonError(RuntimeError):
     """Raised when the EmailBison API returns a non-successful response."""
 
 
+class _IdBatchCoalescer:
+    """Merge ID lists from concurrent callers into a single request.
+
+    When no request is in flight, the first ``submit`` is sent on the next loop
+    iteration, so only calls made in the same iteration join it. While a request
+    is running, a new batch instead stays open for ``window`` seconds. IDs in a
+    batch (up to ``max_size``) are de-duplicated and handed to ``send`` once, and
+    every caller in it receives the same response or exception. ``on_idle`` is
+    called once nothing is pending or in flight, so owners can drop the batcher.
+    """
+
+    __slots__ = ("_send", "_window", "_max_size", "_on_idle", "_ids", "_waiters", "_timer", "_tasks")
+
+    def __init__(
+        self,
+        send: Callable[[list[int]], Awaitable[Any]],
+        *,
+        window: float = _WARMUP_COALESCE_WINDOW,
+        max_size: int = _TAG_BATCH_SIZE,
+        on_idle: Callable[[_IdBatchCoalescer], None] | None = None,
+    ) -> None:
+        self._send = send
+        self._window = window
+        self._max_size = max_size
+        self._on_idle = on_idle
+        self._ids: list[int] = []
+        self._waiters: list[asyncio.Future[Any]] = []
+        self._timer: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, ids: Iterable[int]) -> Any:
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[Any] = loop.create_future()
+        self._ids.extend(ids)
+        self._waiters.append(waiter)
+        if len(self._ids) >= self._max_size:
+            self._flush()
+        elif self._timer is None:
+            if self._tasks:
+                self._timer = loop.call_later(self._window, self._flush)
+            else:
+                self._timer = loop.call_soon(self._flush)
+        return await waiter
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        ids, waiters = list(dict.fromkeys(self._ids)), self._waiters
+        self._ids, self._waiters = [], []
+        if not waiters:
+            self._check_idle()
+            return
+        task = asyncio.get_running_loop().create_task(self._dispatch(ids, waiters))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        self._check_idle()
+
+    def _check_idle(self) -> None:
+        if self._on_idle is not None and not self._tasks and not self._waiters and self._timer is None:
+            self._on_idle(self)
+
+    async def _dispatch(self, ids: list[int], waiters: list[asyncio.Future[Any]]) -> None:
+        try:
+            result = await self._send(ids)
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001 - re-raised in every caller
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(result)
+
+
 class PaginatedLeadsResponse(BaseModel):
     data: list[dict[str, Any]]
     page: int = 1
@@ -23,34 +420,134 @@ class PaginatedLeadsResponse(BaseModel):
 class EmailBisonClient:
     """Minimal async-friendly client for the EmailBison REST API."""
 
+    __slots__ = (
+        "_api_key",
+        "_base_url",
+        "_timeout",
+        "_compress_requests",
+        "_client",
+        "_client_loop",
+        "_headers",
+        "_enable_warmup_batcher",
+        "_disable_warmup_batcher",
+        "_warmup_limit_batchers",
+        "_etag_cache",
+        "_max_concurrency",
+        "_request_slots",
+    )
+
     def __init__(
         self,
         api_key: str,
         *,
         base_url: str = "https://api.emailbison.com/v1",
         timeout: float = 30.0,
+        compress_requests: bool = False,
+        max_concurrency: int = _REQUEST_CONCURRENCY,
     ) -> None:
+        """
+        Args:
+            api_key: Workspace API key sent as a bearer token.
+            base_url: REST base URL.
+            timeout: Request timeout in seconds.
+            compress_requests: Gzip JSON bodies larger than 2 KiB. Only enable this
+                when the API deployment accepts ``Content-Encoding: gzip`` requests.
+            max_concurrency: Maximum number of requests this client has in flight
+                at once; further calls wait for a free slot.
+        """
         if not api_key:
             raise ValueError("EmailBison API key is required.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
 
         self._api_key = api_key
+        self._base_url = base_url.rstrip("/")
         self._timeout = timeout
-        self._client = httpx.AsyncClient(
-            base_url=base_url.rstrip("/"),
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            timeout=timeout,
-        )
+        self._compress_requests = compress_requests
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: weakref.ref[asyncio.AbstractEventLoop] | None = None
+        # Default headers for the pooled client. Content-Type is set per request
+        # so multipart uploads can carry their own boundary header.
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "application/json",
+        }
+        # Concurrent warmup enable/disable calls are merged into one PATCH each.
+        self._enable_warmup_batcher = _IdBatchCoalescer(self._send_enable_warmup)
+        self._disable_warmup_batcher = _IdBatchCoalescer(self._send_disable_warmup)
+        self._warmup_limit_batchers: dict[tuple[int, Optional[str]], _IdBatchCoalescer] = {}
+        # (path, params, body) -> (etag, parsed body) for conditional GETs.
+        # JSON bodies are kept as raw bytes and parsed again on every 304, so no two
+        # callers ever share (and can mutate) the same decoded object.
+        self._etag_cache: OrderedDict[tuple[str, str, bytes], tuple[str, bytes | str]] = OrderedDict()
+        self._max_concurrency = max_concurrency
+        # Created alongside the pooled client, since it is bound to the same loop.
+        self._request_slots: asyncio.Semaphore | None = None
 
     @property
     def client(self) -> httpx.AsyncClient:
+        """Return the pooled httpx client for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is None
+            or self._client_loop() is not loop
+        ):
+            key = (self._api_key, self._base_url)
+            pools = _SHARED_HTTP_CLIENTS.get(loop)
+            if pools is None:
+                pools = _SHARED_HTTP_CLIENTS[loop] = {}
+            shared = pools.get(key)
+            if shared is None or shared.is_closed:
+                shared = httpx.AsyncClient(
+                    base_url=self._base_url,
+                    headers=self._headers,
+                    # Never fail on waiting for a free pooled connection; the
+                    # read/write/connect budgets still apply.
+                    timeout=httpx.Timeout(self._timeout, pool=None),
+                    # Pool limits and HTTP/2 live on the transport; httpx ignores
+                    # the client-level arguments when a transport is supplied.
+                    transport=httpx.AsyncHTTPTransport(
+                        http2=_HTTP2_AVAILABLE,
+                        limits=_POOL_LIMITS,
+                        retries=_CONNECT_RETRIES,
+                    ),
+                )
+                pools[key] = shared
+            self._client = shared
+            self._client_loop = weakref.ref(loop)
+            self._request_slots = asyncio.Semaphore(self._max_concurrency)
         return self._client
 
+    async def __aenter__(self) -> EmailBisonClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the API host ahead of the first request.
+
+        Sends a ``HEAD`` to the base URL so DNS, TCP and TLS are done before a
+        tool call needs them. Any response status is fine and errors are ignored.
+        """
+        try:
+            await self.client.head("/")
+        except httpx.HTTPError:
+            pass
+
     async def close(self) -> None:
+        if self._client is None:
+            return
+        loop = self._client_loop() if self._client_loop is not None else None
+        pools = _SHARED_HTTP_CLIENTS.get(loop) if loop is not None else None
+        key = (self._api_key, self._base_url)
+        if pools is not None and pools.get(key) is self._client:
+            del pools[key]
         await self._client.aclose()
+        self._client = None
+        self._client_loop = None
 
     async def request(
         self,
@@ -60,65 +557,81 @@ class EmailBisonClient:
         params: Optional[Mapping[str, Any]] = None,
         json_body: Optional[Mapping[str, Any]] = None,
     ) -> Any:
-        """Execute an HTTP request and raise EmailBisonError on failure."""
-        response = await self._client.request(
-            method,
-            path,
-            params=params,
-            json=json_body,
-        )
-        if response.status_code >= 400:
-            try:
-                payload = response.json()
-            except ValueError:
-                payload = {"message": response.text or "Unknown error"}
-            detail = payload.get("message") or payload
-            raise EmailBisonError(f"EmailBison API error ({response.status_code}): {detail}")
-        if response.headers.get("Content-Type", "").startswith("application/json"):
-            return response.json()
-        return response.text
+        """Execute an HTTP request and raise EmailBisonError on failure.
+
+        GET responses carrying an ``ETag`` are remembered, and repeated identical
+        GETs are sent with ``If-None-Match`` so a ``304`` reuses the stored body.
+        Rate-limited (429) calls, and GETs that hit a 502/503/504, are retried up
+        to ``_RETRY_ATTEMPTS`` times, waiting as ``Retry-After`` asks when given.
+        """
+        content = _dumps(json_body) if json_body is not None else None
+        # Most requests reuse the shared header constant; a copy is made only
+        # when conditional or compression headers are needed.
+        headers: Mapping[str, str] | None = _JSON_REQUEST_HEADERS if content is not None else None
+        cache_key: tuple[str, str, bytes] | None = None
+        if method == "GET":
+            cache_key = (path, repr(sorted(params.items())) if params else "", content or b"")
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers = {**(headers or {}), "If-None-Match": cached[0]}
+        if self._compress_requests and content is not None and len(content) > _GZIP_MIN_BYTES:
+            content = gzip.compress(content, compresslevel=1)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+
+        http = self.client
+        for attempt in range(_RETRY_ATTEMPTS + 1):
+            # Only the HTTP call holds a slot; retry waits happen outside it.
+            async with self._request_slots:
+                response = await http.request(
+                    method,
+                    path,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                )
+            status = response.status_code
+            if attempt == _RETRY_ATTEMPTS or not (
+                status in _RETRY_STATUS_ANY_METHOD or (method == "GET" and status in _RETRY_STATUS_GET)
+            ):
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+        if cache_key is not None and response.status_code == 304:
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                self._etag_cache.move_to_end(cache_key)
+                body = cached[1]
+                return _loads(body) if isinstance(body, bytes) else body
+        self._raise_for_status(response)
+        result = self._maybe_parse_json(response)
+        if cache_key is not None:
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[cache_key] = (etag, result if isinstance(result, str) else response.content)
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > _ETAG_CACHE_MAXSIZE:
+                    self._etag_cache.popitem(last=False)
+            else:
+                self._etag_cache.pop(cache_key, None)
+        return result
 
     @staticmethod
-    def _to_camel(snake_key: str) -> str:
-        parts = snake_key.split("_")
-        return parts[0] + "".join(part.capitalize() for part in parts[1:]) if parts else snake_key
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise EmailBisonError with the API's message for 4xx/5xx responses."""
+        if response.status_code < 400:
+            return
+        try:
+            payload = _loads(response.content)
+        except ValueError:
+            payload = {"message": response.text or "Unknown error"}
+        detail = payload.get("message") or payload
+        raise EmailBisonError(f"EmailBison API error ({response.status_code}): {detail}")
 
     @staticmethod
-    def _serialize_param_value(value: Any) -> Any:
-        if isinstance(value, bool):
-            return str(value).lower()
-        if isinstance(value, (list, tuple, set)):
-            return ",".join(str(item) for item in value)
-        return value
-
-    def _prepare_query(
-        self,
-        base: Mapping[str, Any],
-        extra_filters: Optional[Mapping[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        params: Dict[str, Any] = {}
-        for key, value in base.items():
-            if value is None or value == "":
-                continue
-            # Preserve dot notation (e.g., "filters.lead_campaign_status")
-            param_key = key if "." in key else self._to_camel(key)
-            # For filter keys with dot notation, pass arrays as-is (httpx will repeat them)
-            if "." in param_key and isinstance(value, (list, tuple, set)):
-                params[param_key] = list(value)
-            else:
-                params[param_key] = self._serialize_param_value(value)
-        if extra_filters:
-            for key, value in extra_filters.items():
-                if value is None or value == "":
-                    continue
-                # Preserve dot notation for filter keys
-                param_key = str(key) if "." in str(key) else self._to_camel(str(key))
-                # For filter keys with dot notation, pass arrays as-is (httpx will repeat them)
-                if "." in param_key and isinstance(value, (list, tuple, set)):
-                    params[param_key] = list(value)
-                else:
-                    params[param_key] = self._serialize_param_value(value)
-        return params
+    def _maybe_parse_json(response: httpx.Response) -> Any:
+        """Return the decoded JSON body, or the raw text for non-JSON responses."""
+        if response.headers.get("content-type", "").lower().startswith(_JSON_CONTENT_TYPES):
+            return _loads(response.content)
+        return response.text
 
     async def list_leads(
         self,
@@ -131,26 +644,52 @@ class EmailBisonClient:
         interested: Optional[bool] = None,
         filters: Optional[Mapping[str, Any]] = None,
     ) -> PaginatedLeadsResponse:
+        payload = await self.list_leads_raw(
+            search=search,
+            status=status,
+            page=page,
+            per_page=per_page,
+            tag_ids=tag_ids,
+            interested=interested,
+            filters=filters,
+        )
+        # ``data`` rows are opaque dicts, so skip per-row validation.
+        return PaginatedLeadsResponse.model_construct(
+            data=payload.get("data", []),
+            page=payload.get("page", 1),
+            per_page=payload.get("perPage", payload.get("per_page", 50)),
+            total=payload.get("total", 0),
+        )
+
+    async def list_leads_raw(
+        self,
+        *,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 50,
+        tag_ids: Optional[Iterable[str]] = None,
+        interested: Optional[bool] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Same as list_leads, but return the decoded API payload without a model wrapper."""
         # GET request uses body for filters
-        body: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        if search is not None:
-            body["search"] = search
-        if status is not None:
-            body["status"] = status
-        if interested is not None:
-            body["interested"] = interested
-        if filters:
-            body["filters"] = dict(filters)
+        body = _pack(
+            (
+                ("page", page),
+                ("per_page", per_page),
+                ("search", search),
+                ("status", status),
+                ("interested", interested),
+            )
+        )
         # If tag_ids is provided separately, add it to filters (for backward compatibility)
         if tag_ids and (not filters or "tag_ids" not in filters):
-            if "filters" not in body:
-                body["filters"] = {}
-            body["filters"]["tag_ids"] = list(tag_ids)
-        payload = await self.request("GET", "/leads", json_body=body)
-        return PaginatedLeadsResponse.model_validate(payload)
+            # Copy only here, since the caller's mapping must not be mutated
+            body["filters"] = {**(filters or {}), "tag_ids": _as_list(tag_ids)}
+        elif filters:
+            body["filters"] = filters if isinstance(filters, dict) else dict(filters)
+        return await self.request("GET", "/leads", json_body=body)
 
     async def create_lead(
         self,
@@ -164,26 +703,24 @@ class EmailBisonClient:
         custom_variables: Optional[list[dict[str, str]]] = None,
         tags: Optional[Iterable[str]] = None,
     ) -> dict[str, Any]:
-        body: Dict[str, Any] = {
-            "email": email,
-            "first_name": first_name,
-            "last_name": last_name,
-        }
-        if company is not None:
-            body["company"] = company
-        if title is not None:
-            body["title"] = title
-        if notes is not None:
-            body["notes"] = notes
-        if custom_variables is not None:
-            body["custom_variables"] = custom_variables
+        body = _pack(
+            (
+                ("email", email),
+                ("first_name", first_name),
+                ("last_name", last_name),
+                ("company", company),
+                ("title", title),
+                ("notes", notes),
+                ("custom_variables", custom_variables),
+            )
+        )
         if tags:
-            body["tags"] = list(tags)
+            body["tags"] = _as_list(tags)
         return await self.request("POST", "/leads", json_body=body)
 
     async def get_lead(self, lead_id: int | str) -> dict[str, Any]:
         """Get a specific lead by its ID or email address."""
-        return await self.request("GET", f"/leads/{lead_id}")
+        return await self.request("GET", _path("/leads/{}", lead_id))
 
     async def update_lead(
         self,
@@ -198,69 +735,61 @@ class EmailBisonClient:
         custom_variables: Optional[list[dict[str, str]]] = None,
     ) -> dict[str, Any]:
         """Update the details of a specific lead. Fields not passed will remain unchanged."""
-        body: Dict[str, Any] = {}
-        if email is not None:
-            body["email"] = email
-        if first_name is not None:
-            body["first_name"] = first_name
-        if last_name is not None:
-            body["last_name"] = last_name
-        if company is not None:
-            body["company"] = company
-        if title is not None:
-            body["title"] = title
-        if notes is not None:
-            body["notes"] = notes
-        if custom_variables is not None:
-            body["custom_variables"] = custom_variables
-        return await self.request("PATCH", f"/leads/{lead_id}", json_body=body)
+        body = _pack(
+            (
+                ("email", email),
+                ("first_name", first_name),
+                ("last_name", last_name),
+                ("company", company),
+                ("title", title),
+                ("notes", notes),
+                ("custom_variables", custom_variables),
+            )
+        )
+        return await self.request("PATCH", _path("/leads/{}", lead_id), json_body=body)
 
     async def unsubscribe_lead(self, lead_id: int | str) -> dict[str, Any]:
         """Unsubscribe a lead from scheduled emails."""
-        return await self.request("PATCH", f"/leads/{lead_id}/unsubscribe")
+        return await self.request("PATCH", _path("/leads/{}/unsubscribe", lead_id))
 
     async def bulk_create_leads_csv(
         self,
         *,
         name: str,
-        csv_content: str,
+        csv_content: str | bytes | BinaryIO,
         columns_to_map: list[dict[str, str]],
         existing_lead_behavior: Optional[str] = None,
     ) -> dict[str, Any]:
-        """Create multiple leads in a single request using CSV. Requires multipart/form-data."""
+        """Create multiple leads in a single request using CSV. Requires multipart/form-data.
+
+        ``csv_content`` may be a string, bytes, or a binary file object; file objects are
+        streamed by httpx's multipart encoder rather than copied into memory.
+        """
+        if isinstance(csv_content, str):
+            csv_file: BinaryIO = io.BytesIO(csv_content.encode("utf-8"))
+        elif isinstance(csv_content, bytes):
+            csv_file = io.BytesIO(csv_content)
+        else:
+            csv_file = csv_content
         # Prepare form data
-        data: Dict[str, Any] = {
-            "name": name,
-            "csv": csv_content,
-        }
+        data: Dict[str, Any] = {"name": name}
         if existing_lead_behavior is not None:
             data["existing_lead_behavior"] = existing_lead_behavior
         
         # Convert columns_to_map to JSON string for form data
         if columns_to_map:
-            data["columnsToMap"] = json.dumps(columns_to_map)
+            data["columnsToMap"] = _dumps(columns_to_map, non_str_keys=True).decode("utf-8")
         
-        # Use httpx's form data handling (data parameter automatically sets multipart/form-data)
-        # Need to override headers to not include Content-Type (httpx will set it with boundary)
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Accept": "application/json",
-        }
-        response = await self._client.post(
-            "/leads/bulk/csv",
-            data=data,
-            headers=headers,
-        )
-        if response.status_code >= 400:
-            try:
-                payload = response.json()
-            except ValueError:
-                payload = {"message": response.text or "Unknown error"}
-            detail = payload.get("message") or payload
-            raise EmailBisonError(f"EmailBison API error ({response.status_code}): {detail}")
-        if response.headers.get("Content-Type", "").startswith("application/json"):
-            return response.json()
-        return response.text
+        # httpx sets the multipart/form-data Content-Type (with boundary) for files uploads
+        http = self.client
+        async with self._request_slots:
+            response = await http.post(
+                "/leads/bulk/csv",
+                data=data,
+                files={"csv": ("leads.csv", csv_file, "text/csv")},
+            )
+        self._raise_for_status(response)
+        return self._maybe_parse_json(response)
 
     async def list_campaigns(
         self,
@@ -274,21 +803,20 @@ class EmailBisonClient:
     ) -> dict[str, Any]:
         # Use GET with body for filters
         # POST /campaigns is for creating campaigns (requires 'name' field)
-        body: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        if search is not None:
-            body["search"] = search
-        if status is not None:
-            body["status"] = status
-        if filters:
-            body["filters"] = dict(filters)
+        body = _pack(
+            (
+                ("page", page),
+                ("per_page", per_page),
+                ("search", search),
+                ("status", status),
+            )
+        )
         # If tag_ids is provided separately, add it to filters (for backward compatibility)
         if tag_ids and (not filters or "tag_ids" not in filters):
-            if "filters" not in body:
-                body["filters"] = {}
-            body["filters"]["tag_ids"] = [int(tid) for tid in tag_ids]
+            # Copy only here, since the caller's mapping must not be mutated
+            body["filters"] = {**(filters or {}), "tag_ids": [int(tid) for tid in tag_ids]}
+        elif filters:
+            body["filters"] = filters if isinstance(filters, dict) else dict(filters)
         return await self.request("GET", "/campaigns", json_body=body)
 
     async def create_campaign(
@@ -320,16 +848,16 @@ class EmailBisonClient:
     ) -> dict[str, Any]:
         body: Dict[str, Any] = {
             "emailAccountId": email_account_id,
-            "to": list(to),
+            "to": _as_list(to),
             "subject": subject,
             "htmlBody": html_body,
         }
         if cc:
-            body["cc"] = list(cc)
+            body["cc"] = _as_list(cc)
         if bcc:
-            body["bcc"] = list(bcc)
+            body["bcc"] = _as_list(bcc)
         if tags:
-            body["tags"] = list(tags)
+            body["tags"] = _as_list(tags)
         return await self.request("POST", "/emails/send", json_body=body)
 
     async def get_account_details(self) -> dict[str, Any]:
@@ -367,11 +895,66 @@ class EmailBisonClient:
 
     async def get_tag(self, tag_id: int | str) -> dict[str, Any]:
         """Get a specific tag by its ID."""
-        return await self.request("GET", f"/tags/{tag_id}")
+        return await self.request("GET", _path("/tags/{}", tag_id))
 
     async def delete_tag(self, tag_id: int | str) -> dict[str, Any]:
         """Delete a tag by its ID."""
-        return await self.request("DELETE", f"/tags/{tag_id}")
+        return await self.request("DELETE", _path("/tags/{}", tag_id))
+
+    async def _chunk_and_gather(
+        self,
+        path: str,
+        key: str,
+        ids: list[int],
+        tag_ids: list[int],
+        skip_webhooks: Optional[bool],
+        chunk: int = _TAG_BATCH_SIZE,
+    ) -> dict[str, Any]:
+        """POST a tag attach/remove request, splitting large ID lists into concurrent batches.
+
+        The result has the API's usual shape whatever the input size: batch payloads
+        are merged by concatenating list ``data`` and otherwise keeping the first
+        batch's payload. If any batch fails, EmailBisonError names the batches (by
+        position in ``ids``) that were applied and those that failed.
+        """
+        starts = range(0, max(len(ids), 1), chunk)
+        bodies: list[Dict[str, Any]] = []
+        for start in starts:
+            body: Dict[str, Any] = {key: ids[start : start + chunk], "tag_ids": tag_ids}
+            if skip_webhooks is not None:
+                body["skip_webhooks"] = skip_webhooks
+            bodies.append(body)
+        if len(bodies) == 1:
+            return await self.request("POST", path, json_body=bodies[0])
+        results = await asyncio.gather(
+            *(self.request("POST", path, json_body=body) for body in bodies),
+            return_exceptions=True,
+        )
+
+        applied: list[str] = []
+        failed: list[str] = []
+        first_error: BaseException | None = None
+        for start, result in zip(starts, results):
+            span = f"{key}[{start}:{min(start + chunk, len(ids))}]"
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                failed.append(f"{span}: {result}")
+                first_error = first_error or result
+            else:
+                applied.append(span)
+        if first_error is not None:
+            raise EmailBisonError(
+                f"{len(failed)} of {len(bodies)} batches failed ({'; '.join(failed)}). "
+                f"Applied: {', '.join(applied) or 'none'}."
+            ) from first_error
+
+        merged = results[0]
+        if isinstance(merged, Mapping) and all(
+            isinstance(result, Mapping) and isinstance(result.get("data"), list) for result in results
+        ):
+            merged = {**merged, "data": list(chain.from_iterable(result["data"] for result in results))}
+        return merged
 
     async def attach_tags_to_campaigns(
         self,
@@ -381,13 +964,9 @@ class EmailBisonClient:
         skip_webhooks: Optional[bool] = None,
     ) -> dict[str, Any]:
         """Attach multiple tags to campaigns."""
-        body: Dict[str, Any] = {
-            "campaign_ids": campaign_ids,
-            "tag_ids": tag_ids,
-        }
-        if skip_webhooks is not None:
-            body["skip_webhooks"] = skip_webhooks
-        return await self.request("POST", "/tags/attach-to-campaigns", json_body=body)
+        return await self._chunk_and_gather(
+            "/tags/attach-to-campaigns", "campaign_ids", campaign_ids, tag_ids, skip_webhooks
+        )
 
     async def remove_tags_from_campaigns(
         self,
@@ -397,13 +976,9 @@ class EmailBisonClient:
         skip_webhooks: Optional[bool] = None,
     ) -> dict[str, Any]:
         """Detach multiple tags from campaigns."""
-        body: Dict[str, Any] = {
-            "campaign_ids": campaign_ids,
-            "tag_ids": tag_ids,
-        }
-        if skip_webhooks is not None:
-            body["skip_webhooks"] = skip_webhooks
-        return await self.request("POST", "/tags/remove-from-campaigns", json_body=body)
+        return await self._chunk_and_gather(
+            "/tags/remove-from-campaigns", "campaign_ids", campaign_ids, tag_ids, skip_webhooks
+        )
 
     async def attach_tags_to_leads(
         self,
@@ -413,13 +988,9 @@ class EmailBisonClient:
         skip_webhooks: Optional[bool] = None,
     ) -> dict[str, Any]:
         """Attach multiple tags to leads."""
-        body: Dict[str, Any] = {
-            "lead_ids": lead_ids,
-            "tag_ids": tag_ids,
-        }
-        if skip_webhooks is not None:
-            body["skip_webhooks"] = skip_webhooks
-        return await self.request("POST", "/tags/attach-to-leads", json_body=body)
+        return await self._chunk_and_gather(
+            "/tags/attach-to-leads", "lead_ids", lead_ids, tag_ids, skip_webhooks
+        )
 
     async def remove_tags_from_leads(
         self,
@@ -429,13 +1000,9 @@ class EmailBisonClient:
         skip_webhooks: Optional[bool] = None,
     ) -> dict[str, Any]:
         """Detach multiple tags from leads."""
-        body: Dict[str, Any] = {
-            "lead_ids": lead_ids,
-            "tag_ids": tag_ids,
-        }
-        if skip_webhooks is not None:
-            body["skip_webhooks"] = skip_webhooks
-        return await self.request("POST", "/tags/remove-from-leads", json_body=body)
+        return await self._chunk_and_gather(
+            "/tags/remove-from-leads", "lead_ids", lead_ids, tag_ids, skip_webhooks
+        )
 
     async def attach_tags_to_sender_emails(
         self,
@@ -445,13 +1012,9 @@ class EmailBisonClient:
         skip_webhooks: Optional[bool] = None,
     ) -> dict[str, Any]:
         """Attach multiple tags to email accounts (sender emails)."""
-        body: Dict[str, Any] = {
-            "sender_email_ids": sender_email_ids,
-            "tag_ids": tag_ids,
-        }
-        if skip_webhooks is not None:
-            body["skip_webhooks"] = skip_webhooks
-        return await self.request("POST", "/tags/attach-to-sender-emails", json_body=body)
+        return await self._chunk_and_gather(
+            "/tags/attach-to-sender-emails", "sender_email_ids", sender_email_ids, tag_ids, skip_webhooks
+        )
 
     async def remove_tags_from_sender_emails(
         self,
@@ -461,29 +1024,25 @@ class EmailBisonClient:
         skip_webhooks: Optional[bool] = None,
     ) -> dict[str, Any]:
         """Detach multiple tags from email accounts (sender emails)."""
-        body: Dict[str, Any] = {
-            "sender_email_ids": sender_email_ids,
-            "tag_ids": tag_ids,
-        }
-        if skip_webhooks is not None:
-            body["skip_webhooks"] = skip_webhooks
-        return await self.request("POST", "/tags/remove-from-sender-emails", json_body=body)
+        return await self._chunk_and_gather(
+            "/tags/remove-from-sender-emails", "sender_email_ids", sender_email_ids, tag_ids, skip_webhooks
+        )
 
     async def duplicate_campaign(self, campaign_id: int | str) -> dict[str, Any]:
         """Duplicate an existing campaign and return the cloned campaign payload."""
-        return await self.request("POST", f"/campaigns/{campaign_id}/duplicate")
+        return await self.request("POST", _campaign_path(campaign_id, "/duplicate"))
 
     async def pause_campaign(self, campaign_id: int | str) -> dict[str, Any]:
         """Pause a campaign by ID and return the updated campaign payload."""
-        return await self.request("PATCH", f"/campaigns/{campaign_id}/pause")
+        return await self.request("PATCH", _campaign_path(campaign_id, "/pause"))
 
     async def resume_campaign(self, campaign_id: int | str) -> dict[str, Any]:
         """Resume a paused campaign by ID and return the queued campaign payload."""
-        return await self.request("PATCH", f"/campaigns/{campaign_id}/resume")
+        return await self.request("PATCH", _campaign_path(campaign_id, "/resume"))
 
     async def archive_campaign(self, campaign_id: int | str) -> dict[str, Any]:
         """Archive a campaign by ID and return the archived campaign payload."""
-        return await self.request("PATCH", f"/campaigns/{campaign_id}/archive")
+        return await self.request("PATCH", _campaign_path(campaign_id, "/archive"))
 
     async def update_campaign_settings(
         self,
@@ -493,7 +1052,7 @@ class EmailBisonClient:
     ) -> dict[str, Any]:
         """Update campaign settings with provided fields."""
         body = {key: value for key, value in updates.items() if value is not None}
-        return await self.request("PATCH", f"/campaigns/{campaign_id}/update", json_body=body)
+        return await self.request("PATCH", _campaign_path(campaign_id, "/update"), json_body=body)
 
     async def create_campaign_schedule(
         self,
@@ -503,11 +1062,11 @@ class EmailBisonClient:
     ) -> dict[str, Any]:
         """Create or replace the schedule for a campaign."""
         body = dict(schedule)
-        return await self.request("POST", f"/campaigns/{campaign_id}/schedule", json_body=body)
+        return await self.request("POST", _campaign_path(campaign_id, "/schedule"), json_body=body)
 
     async def get_campaign_schedule(self, campaign_id: int | str) -> dict[str, Any]:
         """Fetch the sending schedule for a campaign."""
-        return await self.request("GET", f"/campaigns/{campaign_id}/schedule")
+        return await self.request("GET", _campaign_path(campaign_id, "/schedule"))
 
     async def update_campaign_schedule(
         self,
@@ -517,7 +1076,7 @@ class EmailBisonClient:
     ) -> dict[str, Any]:
         """Completely replace the schedule for a campaign."""
         body = dict(schedule)
-        return await self.request("PUT", f"/campaigns/{campaign_id}/schedule", json_body=body)
+        return await self.request("PUT", _campaign_path(campaign_id, "/schedule"), json_body=body)
 
     async def list_schedule_templates(self) -> dict[str, Any]:
         """Return all saved schedule templates for the workspace."""
@@ -536,7 +1095,7 @@ class EmailBisonClient:
     ) -> dict[str, Any]:
         """Get the sending schedule for a specific campaign on a given day."""
         return await self.request(
-            "GET", f"/campaigns/{campaign_id}/sending-schedule", json_body={"day": day}
+            "GET", _campaign_path(campaign_id, "/sending-schedule"), json_body={"day": day}
         )
 
     async def create_campaign_schedule_from_template(
@@ -545,17 +1104,17 @@ class EmailBisonClient:
         """Create a campaign schedule from a saved template."""
         return await self.request(
             "POST",
-            f"/campaigns/{campaign_id}/create-schedule-from-template",
+            _campaign_path(campaign_id, "/create-schedule-from-template"),
             json_body={"schedule_id": schedule_id},
         )
 
     async def delete_sequence_step(self, sequence_step_id: int | str) -> dict[str, Any]:
         """Delete a specific sequence step from a sequence."""
-        return await self.request("DELETE", f"/campaigns/sequence-steps/{sequence_step_id}")
+        return await self.request("DELETE", _path("/campaigns/sequence-steps/{}", sequence_step_id))
 
     async def get_campaign_sequence_steps(self, campaign_id: int | str) -> dict[str, Any]:
         """Get the sequence steps for a campaign."""
-        return await self.request("GET", f"/campaigns/v1.1/{campaign_id}/sequence-steps")
+        return await self.request("GET", _path("/campaigns/v1.1/{}/sequence-steps", campaign_id))
 
     async def create_campaign_sequence_steps(
         self,
@@ -567,7 +1126,7 @@ class EmailBisonClient:
         """Create campaign sequence steps from scratch."""
         body = {"title": title, "sequence_steps": sequence_steps}
         return await self.request(
-            "POST", f"/campaigns/v1.1/{campaign_id}/sequence-steps", json_body=body
+            "POST", _path("/campaigns/v1.1/{}/sequence-steps", campaign_id), json_body=body
         )
 
     async def update_campaign_sequence_steps(
@@ -580,7 +1139,7 @@ class EmailBisonClient:
         """Update campaign sequence steps. Sequence ID can be found in the Campaign object."""
         body = {"title": title, "sequence_steps": sequence_steps}
         return await self.request(
-            "PUT", f"/campaigns/v1.1/sequence-steps/{sequence_id}", json_body=body
+            "PUT", _path("/campaigns/v1.1/sequence-steps/{}", sequence_id), json_body=body
         )
 
     async def send_sequence_step_test_email(
@@ -600,7 +1159,7 @@ class EmailBisonClient:
             body["use_dedicated_ips"] = use_dedicated_ips
         return await self.request(
             "POST",
-            f"/campaigns/sequence-steps/{sequence_step_id}/test-email",
+            _path("/campaigns/sequence-steps/{}/test-email", sequence_step_id),
             json_body=body,
         )
 
@@ -621,27 +1180,22 @@ class EmailBisonClient:
     ) -> dict[str, Any]:
         """Get all replies associated with a campaign. Returns paginated results. All filter parameters are sent in the request body."""
         # All filter parameters go in the request body, not query parameters
-        body: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        if search is not None:
-            body["search"] = search
-        if status is not None:
-            body["status"] = status
-        if folder is not None:
-            body["folder"] = folder
-        if read is not None:
-            body["read"] = read
-        if sender_email_id is not None:
-            body["sender_email_id"] = sender_email_id
-        if lead_id is not None:
-            body["lead_id"] = lead_id
-        if query_campaign_id is not None:
-            body["campaign_id"] = query_campaign_id
+        body = _pack(
+            (
+                ("page", page),
+                ("per_page", per_page),
+                ("search", search),
+                ("status", status),
+                ("folder", folder),
+                ("read", read),
+                ("sender_email_id", sender_email_id),
+                ("lead_id", lead_id),
+                ("campaign_id", query_campaign_id),
+            )
+        )
         if filters:
-            body["filters"] = dict(filters)
-        return await self.request("POST", f"/campaigns/{campaign_id}/replies", json_body=body)
+            body["filters"] = filters if isinstance(filters, dict) else dict(filters)
+        return await self.request("POST", _campaign_path(campaign_id, "/replies"), json_body=body)
 
     async def get_campaign_leads(
         self,
@@ -654,23 +1208,18 @@ class EmailBisonClient:
     ) -> dict[str, Any]:
         """Get all leads associated with a campaign. Returns paginated results. GET request uses body for filters."""
         # GET request uses body for filters
-        body: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        if search is not None:
-            body["search"] = search
+        body = _pack((("page", page), ("per_page", per_page), ("search", search)))
         if filters:
-            body["filters"] = dict(filters)
-        return await self.request("GET", f"/campaigns/{campaign_id}/leads", json_body=body)
+            body["filters"] = filters if isinstance(filters, dict) else dict(filters)
+        return await self.request("GET", _campaign_path(campaign_id, "/leads"), json_body=body)
 
     async def remove_campaign_leads(
         self, campaign_id: int | str, *, lead_ids: Iterable[int]
     ) -> dict[str, Any]:
         """Remove leads from a campaign."""
-        body = {"lead_ids": [int(lead_id) for lead_id in lead_ids]}
+        body = {"lead_ids": _as_int_list(lead_ids)}
         return await self.request(
-            "DELETE", f"/campaigns/{campaign_id}/leads", json_body=body
+            "DELETE", _campaign_path(campaign_id, "/leads"), json_body=body
         )
 
     async def import_campaign_leads_from_list(
@@ -686,7 +1235,7 @@ class EmailBisonClient:
             body["allow_parallel_sending"] = allow_parallel_sending
         return await self.request(
             "POST",
-            f"/campaigns/{campaign_id}/leads/attach-lead-list",
+            _campaign_path(campaign_id, "/leads/attach-lead-list"),
             json_body=body,
         )
 
@@ -698,12 +1247,12 @@ class EmailBisonClient:
         allow_parallel_sending: bool | None = None,
     ) -> dict[str, Any]:
         """Import leads by their IDs into a campaign. For active campaigns, leads are cached locally and synced every 5 minutes. For reply followup campaigns, this will start from the last sent reply."""
-        body: dict[str, Any] = {"lead_ids": [int(lead_id) for lead_id in lead_ids]}
+        body: dict[str, Any] = {"lead_ids": _as_int_list(lead_ids)}
         if allow_parallel_sending is not None:
             body["allow_parallel_sending"] = allow_parallel_sending
         return await self.request(
             "POST",
-            f"/campaigns/{campaign_id}/leads/attach-leads",
+            _campaign_path(campaign_id, "/leads/attach-leads"),
             json_body=body,
         )
 
@@ -711,10 +1260,10 @@ class EmailBisonClient:
         self, campaign_id: int | str, *, lead_ids: Iterable[int]
     ) -> dict[str, Any]:
         """Stop future emails for selected leads in a campaign."""
-        body = {"lead_ids": [int(lead_id) for lead_id in lead_ids]}
+        body = {"lead_ids": _as_int_list(lead_ids)}
         return await self.request(
             "POST",
-            f"/campaigns/{campaign_id}/leads/stop-future-emails",
+            _campaign_path(campaign_id, "/leads/stop-future-emails"),
             json_body=body,
         )
 
@@ -737,7 +1286,7 @@ class EmailBisonClient:
         # Note: API documentation shows GET with body, but we use POST for requests with bodies
         return await self.request(
             "POST",
-            f"/campaigns/{campaign_id}/scheduled-emails",
+            _campaign_path(campaign_id, "/scheduled-emails"),
             json_body=body if body else None,
         )
 
@@ -745,7 +1294,7 @@ class EmailBisonClient:
         self, campaign_id: int | str
     ) -> dict[str, Any]:
         """Get all email accounts (sender emails) associated with a campaign."""
-        return await self.request("GET", f"/campaigns/{campaign_id}/sender-emails")
+        return await self.request("GET", _campaign_path(campaign_id, "/sender-emails"))
 
     async def get_campaign_stats(
         self, campaign_id: int | str, *, start_date: str, end_date: str
@@ -753,17 +1302,17 @@ class EmailBisonClient:
         """Get campaign statistics (summary) for a date range. Returns overall stats and per-sequence-step stats."""
         body = {"start_date": start_date, "end_date": end_date}
         return await self.request(
-            "POST", f"/campaigns/{campaign_id}/stats", json_body=body
+            "POST", _campaign_path(campaign_id, "/stats"), json_body=body
         )
 
     async def attach_sender_emails_to_campaign(
         self, campaign_id: int | str, *, sender_email_ids: Iterable[int]
     ) -> dict[str, Any]:
         """Attach sender emails to a campaign by their IDs."""
-        body = {"sender_email_ids": [int(sender_id) for sender_id in sender_email_ids]}
+        body = {"sender_email_ids": _as_int_list(sender_email_ids)}
         return await self.request(
             "POST",
-            f"/campaigns/{campaign_id}/attach-sender-emails",
+            _campaign_path(campaign_id, "/attach-sender-emails"),
             json_body=body,
         )
 
@@ -771,10 +1320,10 @@ class EmailBisonClient:
         self, campaign_id: int | str, *, sender_email_ids: Iterable[int]
     ) -> dict[str, Any]:
         """Remove sender emails from a draft or paused campaign by their IDs."""
-        body = {"sender_email_ids": [int(sender_id) for sender_id in sender_email_ids]}
+        body = {"sender_email_ids": _as_int_list(sender_email_ids)}
         return await self.request(
             "DELETE",
-            f"/campaigns/{campaign_id}/remove-sender-emails",
+            _campaign_path(campaign_id, "/remove-sender-emails"),
             json_body=body,
         )
 
@@ -785,13 +1334,13 @@ class EmailBisonClient:
         params = {"start_date": start_date, "end_date": end_date}
         return await self.request(
             "GET",
-            f"/campaigns/{campaign_id}/line-area-chart-stats",
+            _campaign_path(campaign_id, "/line-area-chart-stats"),
             params=params,
         )
 
     async def get_campaign_details(self, campaign_id: int | str) -> dict[str, Any]:
         """Get the details of a specific campaign."""
-        return await self.request("GET", f"/campaigns/{campaign_id}")
+        return await self.request("GET", _campaign_path(campaign_id))
 
     async def list_replies(
         self,
@@ -808,28 +1357,44 @@ class EmailBisonClient:
         per_page: int = 15,
     ) -> dict[str, Any]:
         """Get all replies for the authenticated user. Returns paginated results. Uses GET request with query parameters."""
-        base_filters: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        if search is not None:
-            base_filters["search"] = search
-        if status is not None:
-            base_filters["status"] = status
-        if folder is not None:
-            base_filters["folder"] = folder
-        if read is not None:
-            base_filters["read"] = read
-        if campaign_id is not None:
-            base_filters["campaign_id"] = campaign_id
-        if sender_email_id is not None:
-            base_filters["sender_email_id"] = sender_email_id
-        if lead_id is not None:
-            base_filters["lead_id"] = lead_id
-        if tag_ids:
-            base_filters["tag_ids"] = list(tag_ids)
-        params = self._prepare_query(base_filters)
-        return await self.request("GET", "/replies", params=params)
+        base_filters = _pack(
+            (
+                ("page", page),
+                ("per_page", per_page),
+                ("search", search),
+                ("status", status),
+                ("folder", folder),
+                ("read", read),
+                ("campaign_id", campaign_id),
+                ("sender_email_id", sender_email_id),
+                ("lead_id", lead_id),
+                ("tag_ids", _as_list(tag_ids) if tag_ids else None),
+            )
+        )
+        if base_filters.keys() == {"page", "per_page"}:
+            # Only pagination is set (the common case): nothing to normalize
+            params = {"page": page, "perPage": per_page}
+        else:
+            params = _prepare_query(base_filters)
+        return await self.request("GET", _EP_REPLIES, params=params)
+
+    def iter_replies(
+        self,
+        *,
+        per_page: int = 15,
+        max_concurrency: int = _PAGINATION_CONCURRENCY,
+        **filters: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every page of list_replies via ``iter_pages`` (pages may arrive out of order).
+
+        ``filters`` accepts the keyword arguments of list_replies other than
+        ``page``/``per_page``.
+        """
+        return iter_pages(
+            lambda page: self.list_replies(page=page, per_page=per_page, **filters),
+            per_page=per_page,
+            max_concurrency=max_concurrency,
+        )
 
     async def get_lead_replies(
         self,
@@ -844,35 +1409,31 @@ class EmailBisonClient:
         tag_ids: Optional[Iterable[int]] = None,
     ) -> dict[str, Any]:
         """Get all replies for a specific lead. Uses GET request with query parameters."""
-        base_filters: Dict[str, Any] = {}
-        if search is not None:
-            base_filters["search"] = search
-        if status is not None:
-            base_filters["status"] = status
-        if folder is not None:
-            base_filters["folder"] = folder
-        if read is not None:
-            base_filters["read"] = read
-        if campaign_id is not None:
-            base_filters["campaign_id"] = campaign_id
-        if sender_email_id is not None:
-            base_filters["sender_email_id"] = sender_email_id
-        if tag_ids:
-            base_filters["tag_ids"] = list(tag_ids)
-        params = self._prepare_query(base_filters)
-        return await self.request("GET", f"/leads/{lead_id}/replies", params=params)
+        base_filters = _pack(
+            (
+                ("search", search),
+                ("status", status),
+                ("folder", folder),
+                ("read", read),
+                ("campaign_id", campaign_id),
+                ("sender_email_id", sender_email_id),
+                ("tag_ids", _as_list(tag_ids) if tag_ids else None),
+            )
+        )
+        params = _prepare_query(base_filters) if base_filters else None
+        return await self.request("GET", _path("/leads/{}/replies", lead_id), params=params)
 
     async def get_lead_scheduled_emails(self, lead_id: int | str) -> dict[str, Any]:
         """Get all scheduled emails for a specific lead."""
-        return await self.request("GET", f"/leads/{lead_id}/scheduled-emails")
+        return await self.request("GET", _path("/leads/{}/scheduled-emails", lead_id))
 
     async def get_lead_sent_emails(self, lead_id: int | str) -> dict[str, Any]:
         """Get all sent campaign emails for a specific lead."""
-        return await self.request("GET", f"/leads/{lead_id}/sent-emails")
+        return await self.request("GET", _path("/leads/{}/sent-emails", lead_id))
 
     async def get_reply(self, reply_id: int | str) -> dict[str, Any]:
         """Get a specific reply by its ID."""
-        return await self.request("GET", f"/replies/{reply_id}")
+        return await self.request("GET", _path("/replies/{}", reply_id))
 
     async def compose_new_email(
         self,
@@ -888,25 +1449,20 @@ class EmailBisonClient:
         use_dedicated_ips: Optional[bool] = None,
     ) -> dict[str, Any]:
         """Send a one-off email in a new email thread."""
-        body: Dict[str, Any] = {
-            "sender_email_id": sender_email_id,
-            "to_emails": to_emails,
-        }
-        if subject is not None:
-            body["subject"] = subject
-        if message is not None:
-            body["message"] = message
-        if content_type is not None:
-            body["content_type"] = content_type
-        if cc_emails is not None:
-            body["cc_emails"] = cc_emails
-        if bcc_emails is not None:
-            body["bcc_emails"] = bcc_emails
-        if attachments is not None:
-            body["attachments"] = attachments
-        if use_dedicated_ips is not None:
-            body["use_dedicated_ips"] = use_dedicated_ips
-        return await self.request("POST", "/replies/new", json_body=body)
+        body = _pack(
+            (
+                ("sender_email_id", sender_email_id),
+                ("to_emails", to_emails),
+                ("subject", subject),
+                ("message", message),
+                ("content_type", content_type),
+                ("cc_emails", cc_emails),
+                ("bcc_emails", bcc_emails),
+                ("attachments", attachments),
+                ("use_dedicated_ips", use_dedicated_ips),
+            )
+        )
+        return await self.request("POST", _EP_REPLIES_NEW, json_body=body)
 
     async def create_reply(
         self,
@@ -923,25 +1479,20 @@ class EmailBisonClient:
         use_dedicated_ips: Optional[bool] = None,
     ) -> dict[str, Any]:
         """Reply to an existing email thread."""
-        body: Dict[str, Any] = {
-            "sender_email_id": sender_email_id,
-            "to_emails": to_emails,
-        }
-        if message is not None:
-            body["message"] = message
-        if content_type is not None:
-            body["content_type"] = content_type
-        if cc_emails is not None:
-            body["cc_emails"] = cc_emails
-        if bcc_emails is not None:
-            body["bcc_emails"] = bcc_emails
-        if attachments is not None:
-            body["attachments"] = attachments
-        if inject_previous_email_body is not None:
-            body["inject_previous_email_body"] = inject_previous_email_body
-        if use_dedicated_ips is not None:
-            body["use_dedicated_ips"] = use_dedicated_ips
-        return await self.request("POST", f"/replies/{reply_id}/reply", json_body=body)
+        body = _pack(
+            (
+                ("sender_email_id", sender_email_id),
+                ("to_emails", to_emails),
+                ("message", message),
+                ("content_type", content_type),
+                ("cc_emails", cc_emails),
+                ("bcc_emails", bcc_emails),
+                ("attachments", attachments),
+                ("inject_previous_email_body", inject_previous_email_body),
+                ("use_dedicated_ips", use_dedicated_ips),
+            )
+        )
+        return await self.request("POST", _path("/replies/{}/reply", reply_id), json_body=body)
 
     async def list_sender_emails(
         self,
@@ -954,8 +1505,8 @@ class EmailBisonClient:
         if search is not None:
             body["search"] = search
         if filters:
-            body["filters"] = dict(filters)
-        return await self.request("GET", "/sender-emails", json_body=body)
+            body["filters"] = filters if isinstance(filters, dict) else dict(filters)
+        return await self.request("GET", _EP_SENDER_EMAILS, json_body=body)
 
     async def list_sender_emails_with_warmup_stats(
         self,
@@ -966,37 +1517,50 @@ class EmailBisonClient:
         filters: Optional[Mapping[str, Any]] = None,
     ) -> dict[str, Any]:
         """Get all email accounts with warmup stats for the authenticated workspace. Uses GET request with body for filters."""
-        body: Dict[str, Any] = {
-            "start_date": start_date,
-            "end_date": end_date,
-        }
-        if search is not None:
-            body["search"] = search
+        body = _pack(
+            (
+                ("start_date", start_date),
+                ("end_date", end_date),
+                ("search", search),
+            )
+        )
         if filters:
-            body["filters"] = dict(filters)
-        return await self.request("GET", "/warmup/sender-emails", json_body=body)
+            body["filters"] = filters if isinstance(filters, dict) else dict(filters)
+        return await self.request("GET", _EP_WARMUP_SENDER_EMAILS, json_body=body)
 
     async def enable_warmup_for_sender_emails(
         self,
         *,
         sender_email_ids: Iterable[int],
     ) -> dict[str, Any]:
-        """Enable warmup for selected email accounts."""
+        """Enable warmup for selected email accounts.
+
+        Calls made concurrently are coalesced into a single request and share its response.
+        """
+        return await self._enable_warmup_batcher.submit(sender_email_ids)
+
+    async def _send_enable_warmup(self, sender_email_ids: list[int]) -> dict[str, Any]:
         json_body = {
-            "sender_email_ids": list(sender_email_ids),
+            "sender_email_ids": sender_email_ids,
         }
-        return await self.request("PATCH", "/warmup/sender-emails/enable", json_body=json_body)
+        return await self.request("PATCH", _EP_WARMUP_ENABLE, json_body=json_body)
 
     async def disable_warmup_for_sender_emails(
         self,
         *,
         sender_email_ids: Iterable[int],
     ) -> dict[str, Any]:
-        """Disable warmup for selected email accounts."""
+        """Disable warmup for selected email accounts.
+
+        Calls made concurrently are coalesced into a single request and share its response.
+        """
+        return await self._disable_warmup_batcher.submit(sender_email_ids)
+
+    async def _send_disable_warmup(self, sender_email_ids: list[int]) -> dict[str, Any]:
         json_body = {
-            "sender_email_ids": list(sender_email_ids),
+            "sender_email_ids": sender_email_ids,
         }
-        return await self.request("PATCH", "/warmup/sender-emails/disable", json_body=json_body)
+        return await self.request("PATCH", _EP_WARMUP_DISABLE, json_body=json_body)
 
     async def update_daily_warmup_limits(
         self,
@@ -1005,14 +1569,32 @@ class EmailBisonClient:
         daily_limit: int,
         daily_reply_limit: Optional[str] = None,
     ) -> dict[str, Any]:
-        """Update daily warmup limits for selected email accounts."""
-        json_body: Dict[str, Any] = {
-            "sender_email_ids": list(sender_email_ids),
-            "daily_limit": daily_limit,
-        }
-        if daily_reply_limit is not None:
-            json_body["daily_reply_limit"] = daily_reply_limit
-        return await self.request("PATCH", "/warmup/sender-emails/update-daily-warmup-limits", json_body=json_body)
+        """Update daily warmup limits for selected email accounts.
+
+        Concurrent calls with the same limits are coalesced into a single request.
+        """
+        key = (daily_limit, daily_reply_limit)
+        batcher = self._warmup_limit_batchers.get(key)
+        if batcher is None:
+
+            def drop(idle: _IdBatchCoalescer) -> None:
+                # Forget idle batchers so distinct limit pairs do not accumulate
+                if self._warmup_limit_batchers.get(key) is idle:
+                    del self._warmup_limit_batchers[key]
+
+            async def send(ids: list[int]) -> dict[str, Any]:
+                json_body: Dict[str, Any] = {
+                    "sender_email_ids": ids,
+                    "daily_limit": daily_limit,
+                }
+                if daily_reply_limit is not None:
+                    json_body["daily_reply_limit"] = daily_reply_limit
+                return await self.request(
+                    "PATCH", _EP_WARMUP_DAILY_LIMITS, json_body=json_body
+                )
+
+            batcher = self._warmup_limit_batchers[key] = _IdBatchCoalescer(send, on_idle=drop)
+        return await batcher.submit(sender_email_ids)
 
     async def get_sender_email_with_warmup_details(
         self,
@@ -1026,36 +1608,36 @@ class EmailBisonClient:
             "start_date": start_date,
             "end_date": end_date,
         }
-        return await self.request("GET", f"/warmup/sender-emails/{sender_email_id}", params=params)
+        return await self.request("GET", _path("/warmup/sender-emails/{}", sender_email_id), params=params)
 
     async def list_workspaces(self) -> dict[str, Any]:
         """Get all workspaces for the authenticated user."""
-        return await self.request("GET", "/workspaces/v1.1")
+        return await self.request("GET", _EP_WORKSPACES)
 
     async def create_workspace(self, *, name: str) -> dict[str, Any]:
         """Create a new workspace."""
         json_body = {
             "name": name,
         }
-        return await self.request("POST", "/workspaces/v1.1", json_body=json_body)
+        return await self.request("POST", _EP_WORKSPACES, json_body=json_body)
 
     async def switch_workspace(self, *, team_id: int) -> dict[str, Any]:
         """Switch to a different workspace."""
         json_body = {
             "team_id": team_id,
         }
-        return await self.request("POST", "/workspaces/v1.1/switch-workspace", json_body=json_body)
+        return await self.request("POST", _EP_WORKSPACES_SWITCH, json_body=json_body)
 
     async def update_workspace(self, team_id: int, *, name: str) -> dict[str, Any]:
         """Update workspace information, specifically the workspace name."""
         json_body = {
             "name": name,
         }
-        return await self.request("PUT", f"/workspaces/v1.1/{team_id}", json_body=json_body)
+        return await self.request("PUT", _path("/workspaces/v1.1/{}", team_id), json_body=json_body)
 
     async def get_workspace_details(self, team_id: int) -> dict[str, Any]:
         """Get the details of a specific workspace."""
-        return await self.request("GET", f"/workspaces/v1.1/{team_id}")
+        return await self.request("GET", _path("/workspaces/v1.1/{}", team_id))
 
     async def invite_team_member(self, *, email: str, role: str) -> dict[str, Any]:
         """Invite a new member to the team."""
@@ -1063,7 +1645,7 @@ class EmailBisonClient:
             "email": email,
             "role": role,
         }
-        return await self.request("POST", "/workspaces/v1.1/invite-members", json_body=json_body)
+        return await self.request("POST", _EP_WORKSPACES_INVITE, json_body=json_body)
 
     async def get_workspace_stats(
         self,
@@ -1076,7 +1658,7 @@ class EmailBisonClient:
             "start_date": start_date,
             "end_date": end_date,
         }
-        return await self.request("GET", "/workspaces/v1.1/stats", params=params)
+        return await self.request("GET", _EP_WORKSPACES_STATS, params=params)
 
     async def get_workspace_line_area_chart_stats(
         self,
@@ -1089,6 +1671,6 @@ class EmailBisonClient:
             "start_date": start_date,
             "end_date": end_date,
         }
-        return await self.request("GET", "/workspaces/v1.1/line-area-chart-stats", params=params)
+        return await self.request("GET", _EP_WORKSPACES_CHART_STATS, params=params)
 
 
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from emailbison_mcp.client import EmailBisonClient
 
+logger = logging.getLogger(__name__)
+
 
 class ClientManagerError(RuntimeError):
     """Raised when there's an error with client management."""
@@ -17,6 +22,20 @@ class ClientManagerError(RuntimeError):
 class ClientManager:
     """Manages multiple EmailBison API clients based on configuration."""
 
+    __slots__ = (
+        "default_base_url",
+        "default_timeout",
+        "default_concurrency",
+        "compress_requests",
+        "config_path",
+        "config",
+        "_client_cache",
+        "_clients",
+        "_default_client",
+        "_client_names_sorted",
+        "_resolved",
+    )
+
     def __init__(
         self,
         config_path: str | None = None,
@@ -24,6 +43,8 @@ class ClientManager:
         config_dict: dict[str, Any] | None = None,
         default_base_url: str = "https://send.longrun.agency/api",
         default_timeout: float = 30.0,
+        default_concurrency: int = 8,
+        compress_requests: bool = False,
     ) -> None:
         """
         Initialize the ClientManager.
@@ -35,9 +56,13 @@ class ClientManager:
                 config_path is ignored.
             default_base_url: Default base URL for API requests.
             default_timeout: Default timeout for API requests in seconds.
+            default_concurrency: Maximum concurrent API requests per client.
+            compress_requests: Gzip large JSON request bodies (see EmailBisonClient).
         """
         self.default_base_url = default_base_url
         self.default_timeout = default_timeout
+        self.default_concurrency = default_concurrency
+        self.compress_requests = compress_requests
         self._client_cache: dict[str, EmailBisonClient] = {}
         
         if config_dict is not None:
@@ -58,16 +83,20 @@ class ClientManager:
         if self.config_path is None:
             raise ClientManagerError("No config_path provided and no config_dict provided.")
             
-        config_file = Path(self.config_path)
-        if not config_file.exists():
+        try:
+            raw = Path(self.config_path).read_bytes()
+        except FileNotFoundError as e:
             raise ClientManagerError(
                 f"Configuration file not found: {self.config_path}\n"
                 f"Please create a config.json file or set EMAILBISON_API_KEY environment variable."
-            )
+            ) from e
+        except Exception as e:
+            raise ClientManagerError(
+                f"Error reading configuration file {self.config_path}: {e}"
+            ) from e
 
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = json.loads(raw)
         except json.JSONDecodeError as e:
             raise ClientManagerError(
                 f"Invalid JSON in configuration file {self.config_path}: {e}"
@@ -100,6 +129,12 @@ class ClientManager:
 
         # Validate each client configuration
         for client_name, client_config in clients.items():
+            # Fast path: a well-formed entry needs one dict lookup and two checks
+            mcp_key = client_config.get("mcp_key") if isinstance(client_config, dict) else None
+            if isinstance(mcp_key, str) and mcp_key.strip():
+                continue
+
+            # Slow path: work out which rule the entry breaks
             if not isinstance(client_config, dict):
                 raise ClientManagerError(
                     f'Client "{client_name}" configuration must be an object.'
@@ -134,15 +169,51 @@ class ClientManager:
                     f"Available clients: {available}"
                 )
 
+        # Cache lookups used on every tool call
+        self._clients: dict[str, dict[str, Any]] = clients
+        self._default_client: str | None = self.config.get("default_client")
+        self._client_names_sorted: list[str] = sorted(clients)
+        self._resolved: dict[str, tuple[str, str]] = {
+            name: (
+                cfg["mcp_key"],
+                (cfg.get("mcp_url") or "").strip() or self.default_base_url,
+            )
+            for name, cfg in clients.items()
+        }
+
+    def _resolve_client_name(self, client_name: str | None) -> str:
+        """Resolve ``client_name`` (or the default) to a configured client name."""
+        if client_name is None:
+            client_name = self._default_client
+            if client_name is None:
+                available = ", ".join(self._client_names_sorted)
+                raise ClientManagerError(
+                    f"No client_name provided and no default_client specified in config. "
+                    f"Please specify a client_name. Available clients: {available}"
+                )
+
+        if client_name not in self._clients:
+            available = ", ".join(self._client_names_sorted)
+            raise ClientManagerError(
+                f'Client "{client_name}" not found in configuration. '
+                f"Available clients: {available}"
+            )
+
+        return client_name
+
     def get_default_client_name(self) -> str | None:
         """Get the default client name from configuration."""
-        return self.config.get("default_client")
+        return self._default_client
 
     def list_clients(self) -> list[str]:
         """Return a list of all configured client names."""
-        return sorted(self.config.get("clients", {}).keys())
+        return list(self._client_names_sorted)
+
+    def cached_clients(self) -> list[EmailBisonClient]:
+        """Return the EmailBisonClient instances created so far."""
+        return list(self._client_cache.values())
 
-    def get_client_config(self, client_name: str | None = None) -> dict[str, str]:
+    def get_client_config(self, client_name: str | None = None) -> Mapping[str, str]:
         """
         Get the full configuration for a client.
 
@@ -150,31 +221,13 @@ class ClientManager:
             client_name: Name of the client. If None, uses the default client.
 
         Returns:
-            Dictionary with client configuration (mcp_key, mcp_url).
+            Read-only view of the client configuration (mcp_key, mcp_url).
 
         Raises:
             ClientManagerError: If client is not found or no default is set.
         """
-        # Resolve client name
-        if client_name is None:
-            client_name = self.get_default_client_name()
-            if client_name is None:
-                available = ", ".join(self.list_clients())
-                raise ClientManagerError(
-                    f"No client_name provided and no default_client specified in config. "
-                    f"Please specify a client_name. Available clients: {available}"
-                )
-
-        # Get client configuration
-        clients = self.config.get("clients", {})
-        if client_name not in clients:
-            available = ", ".join(self.list_clients())
-            raise ClientManagerError(
-                f'Client "{client_name}" not found in configuration. '
-                f"Available clients: {available}"
-            )
-
-        return dict(clients[client_name])
+        client_name = self._resolve_client_name(client_name)
+        return MappingProxyType(self._clients[client_name])
 
     def get_mcp_key(self, client_name: str | None = None) -> str:
         """
@@ -189,8 +242,7 @@ class ClientManager:
         Raises:
             ClientManagerError: If client is not found or no default is set.
         """
-        config = self.get_client_config(client_name)
-        return config["mcp_key"]
+        return self._resolved[self._resolve_client_name(client_name)][0]
 
     def get_mcp_url(self, client_name: str | None = None) -> str:
         """
@@ -205,9 +257,7 @@ class ClientManager:
         Raises:
             ClientManagerError: If client is not found or no default is set.
         """
-        config = self.get_client_config(client_name)
-        mcp_url = config.get("mcp_url", "")
-        return mcp_url.strip() if mcp_url else self.default_base_url
+        return self._resolved[self._resolve_client_name(client_name)][1]
 
     def get_or_create_client(
         self, client_name: str | None = None, timeout: float | None = None
@@ -215,6 +265,9 @@ class ClientManager:
         """
         Get or create a cached EmailBisonClient for a client.
 
+        Cached clients are safe to reuse across event loops: each EmailBisonClient
+        opens its HTTP connection pool lazily, per running loop, on first request.
+
         Args:
             client_name: Name of the client. If None, uses the default client.
             timeout: Request timeout in seconds. If None, uses default_timeout.
@@ -225,29 +278,22 @@ class ClientManager:
         Raises:
             ClientManagerError: If client is not found or no default is set.
         """
-        # Resolve client name
-        if client_name is None:
-            client_name = self.get_default_client_name()
-            if client_name is None:
-                available = ", ".join(self.list_clients())
-                raise ClientManagerError(
-                    f"No client_name provided and no default_client specified in config. "
-                    f"Please specify a client_name. Available clients: {available}"
-                )
+        client_name = self._resolve_client_name(client_name)
 
         # Check cache
         if client_name in self._client_cache:
             return self._client_cache[client_name]
 
         # Create new client
-        api_key = self.get_mcp_key(client_name)
-        base_url = self.get_mcp_url(client_name)
+        api_key, base_url = self._resolved[client_name]
         timeout = timeout if timeout is not None else self.default_timeout
 
         client = EmailBisonClient(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
+            max_concurrency=self.default_concurrency,
+            compress_requests=self.compress_requests,
         )
 
         # Cache it
@@ -255,8 +301,20 @@ class ClientManager:
         return client
 
     async def close_all_clients(self) -> None:
-        """Close all cached clients."""
-        for client in self._client_cache.values():
-            await client.close()
+        """
+        Close all cached clients concurrently.
+
+        Uses ``asyncio.gather(..., return_exceptions=True)`` rather than a task
+        group so that one failing close cannot cancel the others mid-shutdown.
+        """
+        names = list(self._client_cache)
+        results = await asyncio.gather(
+            *(client.close() for client in self._client_cache.values()),
+            return_exceptions=True,
+        )
         self._client_cache.clear()
 
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.warning('Error closing client "%s": %r', name, result)
+
@@ -2,883 +2,403 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import os
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Any, Iterable, Mapping
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Iterable, Mapping
 
 import anyio
+import jsonschema
 from dotenv import load_dotenv
 from mcp import types
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.stdio import stdio_server
+from pydantic import BaseModel, Field, ValidationError
 
-from emailbison_mcp.client import EmailBisonClient, EmailBisonError
+from emailbison_mcp.client import EmailBisonClient, EmailBisonError, gather_pages
 from emailbison_mcp.client_manager import ClientManager, ClientManagerError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - fastjsonschema is an optional speedup
+    fastjsonschema = None
+
+try:
+    import uvloop  # noqa: F401  # picked up by anyio's asyncio backend
+except ImportError:  # pragma: no cover - uvloop is an optional speedup
+    _UVLOOP_AVAILABLE = False
+else:
+    _UVLOOP_AVAILABLE = True
+
+_DOTENV_LOADED = False
+
+_DEFAULT_BASE_URL = "https://send.longrun.agency/api"
+
+# Client name used when configuration comes from EMAILBISON_API_KEY alone
+_ENV_CLIENT_NAME = "default"
+
+_MODULE_DIR = Path(__file__).parent
+_CONFIG_PATH = os.fspath(_MODULE_DIR / "config.json")
+
+# Set by lifespan; request handlers inherit it from the server task's context.
+_current_client_manager: ContextVar[ClientManager | None] = ContextVar(
+    "current_client_manager", default=None
+)
+
+# Tool results are rendered as text for the model, so non-ASCII stays unescaped.
+_pretty_json_encode = json.JSONEncoder(indent=2, sort_keys=True, ensure_ascii=False).encode
+
 
 def _json(data: Any) -> str:
-    return json.dumps(data, indent=2, sort_keys=True)
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles those
+    return _pretty_json_encode(data)
+
+
+class _Settings(BaseModel):
+    """Environment settings read once per process by lifespan."""
+
+    base_url: str = Field(default=_DEFAULT_BASE_URL, alias="EMAILBISON_BASE_URL")
+    timeout: float = Field(default=30.0, alias="EMAILBISON_TIMEOUT_SECONDS")
+    concurrency: int = Field(default=8, ge=1, alias="EMAILBISON_CONCURRENCY")
+    compress_requests: bool = Field(default=False, alias="EMAILBISON_COMPRESS_REQUESTS")
+    api_key: str | None = Field(default=None, alias="EMAILBISON_API_KEY")
+
+
+_SETTINGS_ENV_VARS = (
+    "EMAILBISON_BASE_URL",
+    "EMAILBISON_TIMEOUT_SECONDS",
+    "EMAILBISON_CONCURRENCY",
+    "EMAILBISON_COMPRESS_REQUESTS",
+    "EMAILBISON_API_KEY",
+)
+
+
+@lru_cache(maxsize=1)
+def _get_settings() -> _Settings:
+    """Parse the EMAILBISON_* environment variables (after .env has been loaded)."""
+    env = os.environ
+    try:
+        return _Settings.model_validate({name: env[name] for name in _SETTINGS_ENV_VARS if name in env})
+    except ValidationError as e:
+        raise RuntimeError(f"Invalid EmailBison environment configuration: {e}") from e
+
+
+def _build_client_manager(error_prefix: str, **kwargs: Any) -> ClientManager:
+    """Create a ClientManager, reporting configuration problems as RuntimeError."""
+    try:
+        return ClientManager(**kwargs)
+    except ClientManagerError as e:
+        raise RuntimeError(f"{error_prefix}: {e}") from e
 
 
 @asynccontextmanager
 async def lifespan(app: Server):
     """Configure the EmailBison client for the server lifecycle."""
-    load_dotenv(override=True)  # Override any existing environment variables
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv(override=True)  # Override any existing environment variables
+        _DOTENV_LOADED = True
+    settings = _get_settings()
     
-    base_url = os.getenv("EMAILBISON_BASE_URL", "https://send.longrun.agency/api")
-    timeout = float(os.getenv("EMAILBISON_TIMEOUT_SECONDS", "30"))
+    base_url = settings.base_url
+    timeout = settings.timeout
     
     # Try to load config.json first (multi-account mode)
-    from pathlib import Path
-    module_dir = Path(__file__).parent
-    config_path = str(module_dir / "config.json")
+    try:
+        os.stat(_CONFIG_PATH)
+    except FileNotFoundError:
+        has_config = False
+    else:
+        has_config = True
     
     client_manager: ClientManager | None = None
     
-    if Path(config_path).exists():
+    if has_config:
         # Multi-account mode: use config.json
-        try:
-            client_manager = ClientManager(
-                config_path=config_path,
-                default_base_url=base_url,
-                default_timeout=timeout,
-            )
-        except ClientManagerError as e:
-            raise RuntimeError(f"Failed to load configuration: {e}") from e
+        client_manager = _build_client_manager(
+            "Failed to load configuration",
+            config_path=_CONFIG_PATH,
+            default_base_url=base_url,
+            default_timeout=timeout,
+            default_concurrency=settings.concurrency,
+            compress_requests=settings.compress_requests,
+        )
     else:
         # Backward compatibility: use environment variable
-        api_key = os.getenv("EMAILBISON_API_KEY")
+        api_key = settings.api_key
         if not api_key:
             raise RuntimeError(
                 "Neither config.json nor EMAILBISON_API_KEY environment variable found. "
                 "Please create a config.json file or set EMAILBISON_API_KEY."
             )
         
-        # Create in-memory config for backward compatibility
+        # Create in-memory config for backward compatibility. Built fresh on each
+        # entry: ClientManager keeps a reference to it, so a shared template
+        # would leak one session's key into the next.
         temp_config = {
-            "clients": {
-                "default": {
-                    "mcp_key": api_key,
-                    "mcp_url": base_url,
-                }
-            },
-            "default_client": "default",
+            "clients": {_ENV_CLIENT_NAME: {"mcp_key": api_key, "mcp_url": base_url}},
+            "default_client": _ENV_CLIENT_NAME,
         }
         
-        try:
-            client_manager = ClientManager(
-                config_dict=temp_config,
-                default_base_url=base_url,
-                default_timeout=timeout,
-            )
-        except ClientManagerError as e:
-            raise RuntimeError(f"Failed to initialize client manager: {e}") from e
+        client_manager = _build_client_manager(
+            "Failed to initialize client manager",
+            config_dict=temp_config,
+            default_base_url=base_url,
+            default_timeout=timeout,
+            default_concurrency=settings.concurrency,
+            compress_requests=settings.compress_requests,
+        )
     
-    app.client_manager = client_manager  # type: ignore[attr-defined]
+    token = _current_client_manager.set(client_manager)
+    
+    # Prime the default account's connection pool in the background so the first
+    # tool call does not pay for DNS and the TLS handshake.
+    warm_up: asyncio.Future[None] | None = None
+    if client_manager.get_default_client_name() is not None:
+        warm_up = asyncio.ensure_future(client_manager.get_or_create_client().warm_up())
     
     try:
         yield
     finally:
-        await client_manager.close_all_clients()
+        _current_client_manager.reset(token)
+        # Shield the close so cancellation of the session cannot leak open connections
+        with anyio.CancelScope(shield=True):
+            if warm_up is not None:
+                # Wait for the cancelled probe so it cannot reopen the pool mid-close
+                warm_up.cancel()
+                await asyncio.gather(warm_up, return_exceptions=True)
+            # Background requests would otherwise reopen a pool after it is closed
+            await _cancel_background_requests(client_manager.cached_clients())
+            await client_manager.close_all_clients()
+
+
+_INSTRUCTIONS = (_MODULE_DIR / "instructions.md").read_text(encoding="utf-8")
 
 
 server = Server(
     name="emailbison-mcp",
     version="0.1.0",
-    instructions=(
-        "🚨 CRITICAL: Before using ANY tools, you MUST first read the following resources by calling read_resource():\n"
-        "1. document:emailbison/api-reference - API endpoint details and filter parameter formats\n"
-        "2. document:emailbison/pagination - CRITICAL pagination requirements (MUST read before fetching data)\n"
-        "3. document:emailbison/entity-ids - CRITICAL entity ID requirements (MUST read before filtering/searching)\n"
-        "4. document:emailbison/filters - CRITICAL filtering guide (MUST read before using filters)\n"
-        "5. document:emailbison/tags - How to use tags for filtering\n"
-        "6. document:emailbison/mcp-variables - Configuration details\n"
-        "7. document:emailbison/account-details - Account information endpoint\n"
-        "\n"
-        "These resources contain essential information about API behavior, pagination requirements, and parameter formats. "
-        "DO NOT use any tools until you have read at minimum the api-reference, pagination, and entity-ids resources.\n"
-        "\n"
-        "🚨 MULTI-ACCOUNT MODE - CRITICAL: This server supports multiple workspaces via the `client_name` parameter. "
-        "Each API key is automatically associated with its workspace. "
-        "To access different workspaces, simply use the `client_name` parameter in tool calls (e.g., `client_name=\"ATI\"` or `client_name=\"LongRun\"`). "
-        "DO NOT use W_List_Workspaces or W_Switch_Workspace when accessing different workspaces - just specify the correct `client_name`. "
-        "Workspace switching tools are only needed for advanced workspace management within a single account, not for accessing different accounts/workspaces.\n"
-        "\n"
-        "🚨 ENTITY ID REQUIREMENT: Before filtering, searching, or referencing ANY entity (tags, timezones, campaigns, leads, sender emails, workspaces), "
-        "you MUST first call the appropriate list tool to get all available entities and their IDs. "
-        "The API requires IDs (not names) for all entity references. See document:emailbison/entity-ids for details.\n"
-        "\n"
-        "After reading resources, use these tools to query and manage leads, campaigns, and outbound email via the EmailBison API. "
-        "Always confirm required identifiers (lead IDs, campaign IDs, email account IDs) before executing "
-        "actions that mutate state. When filtering by tags, call `list_tags` to retrieve IDs before supplying them "
-        "to other tools.\n"
-        "\n"
-        "🚨 SEQUENCE STEPS UPDATE WORKFLOW: When a user asks to update campaign sequence steps, you MUST follow this workflow:\n"
-        "1. FIRST call C_Get_Campaign_Sequence_Steps with the campaign_id to view all existing sequence steps\n"
-        "2. Review the existing steps to identify which steps need to be updated (note their IDs)\n"
-        "3. THEN call C_Update_Campaign_Sequence_Steps with the sequence_id and include the 'id' field for each step being updated\n"
-        "4. IMPORTANT: Do NOT create new steps when updating existing ones - always include the step 'id' field from the existing steps\n"
-        "5. The sequence_id can be found in the Campaign object (not the campaign_id)\n"
-        "\n"
-        "🚨 VARIABLE FORMAT: When using variables in sequence steps (email_subject, email_body, email_subject_variables), "
-        "ALWAYS use uppercase format with single curly braces: {FIRST_NAME}, {LAST_NAME}, {COMPANY}, etc. "
-        "NEVER use double curly braces or lowercase: NOT {{first_name}} or {{FIRST_NAME}} or {first_name}. "
-        "The correct format is: {FIRST_NAME}, {LAST_NAME}, {COMPANY}, {TITLE}, etc.\n"
-        "\n"
-        "🚨 THREAD REPLY: When creating or updating sequence steps with thread_reply=true, do NOT include 'Re:' prefix in the email_subject. "
-        "The system automatically adds 'Re:' when thread_reply is enabled. If you include 'Re:' manually, it will result in 'Re: Re:' in the final email.\n"
-        "\n"
-        "🚨 VARIANT STEPS AND ORDER FIELD: When creating sequence steps with variants (A/B testing):\n"
-        "- ALL steps (both main and variant): MUST include 'order' field (1, 2, 3, etc.) - order values must be unique and sequential\n"
-        "- Main steps (variant=false or null): require 'order' field\n"
-        "- Variant steps (variant=true): ALSO require 'order' field - variants need order just like main steps\n"
-        "- Variants need: variant=true + variant_from_step (or variant_from_step_id) + order field\n"
-        "\n"
-        "🚨 CRITICAL: Before making ANY create or update request for sequence steps, you MUST:\n"
-        "1. RECHECK the order of ALL steps in your request (both main and variant steps)\n"
-        "2. Ensure ALL steps have correct sequential order values (1, 2, 3, etc.) with no gaps or duplicates\n"
-        "3. Verify that order values are correct for ALL steps before sending the request\n"
-        "DO NOT send the request until you have verified and corrected the order for all steps!"
-    ),
+    instructions=_INSTRUCTIONS,
     website_url="https://docs.emailbison.com/get-started",
     lifespan=lifespan,
 )
 
 
-RESOURCE_DEFINITIONS: dict[str, dict[str, str]] = {
+_RESOURCE_DIR = _MODULE_DIR / "resources"
+
+# Shared prefixes for the resource and tool descriptions below
+_REQUIRED_READING = "🚨 REQUIRED READING: "
+_CRITICAL_REQUIRED_READING = "🚨 CRITICAL REQUIRED READING: "
+_REQUIRED_FIRST_STEP = "🚨 REQUIRED FIRST STEP: "
+
+
+def _first_step(tool_name: str, purpose: str) -> str:
+    """Build the "REQUIRED FIRST STEP" sentence pointing at a lookup tool."""
+    return f"{_REQUIRED_FIRST_STEP}You MUST first call {tool_name} to {purpose}. "
+
+
+# Enum values used by more than one tool schema; each schema references the same list
+_REPLY_STATUSES = ["interested", "automated_reply", "not_automated_reply"]
+_REPLY_FOLDERS = ["inbox", "sent", "spam", "bounced", "all"]
+_SCHEDULED_EMAIL_DAYS = ["today", "tomorrow", "day_after_tomorrow"]
+_CONTENT_TYPES = ["html", "text"]
+_COMPARISON_OPERATORS = ["=", ">=", ">", "<=", "<"]
+
+# Shared pieces of the {"criteria": <operator>, "value": ...} filter schemas
+_COMPARISON_OPERATOR = {
+    "type": "string",
+    "enum": _COMPARISON_OPERATORS,
+    "description": "Comparison operator.",
+}
+_DATE_FILTER_VALUE = {
+    "type": "string",
+    "format": "date",
+    "description": "Date value in YYYY-MM-DD format.",
+}
+
+
+# Shared "all_pages" flag of the paginated list tools (see _fetch_pages)
+_ALL_PAGES_PROPERTY = {
+    "type": "boolean",
+    "default": False,
+    "description": "When true, fetch every page concurrently and return all results in one response (page is ignored; per_page defaults to 100).",
+}
+
+
+def _comparison_filter(description: str, value: dict[str, Any]) -> dict[str, Any]:
+    """Build a filter schema pairing a comparison operator with a value."""
+    return {
+        "type": "object",
+        "description": description,
+        "properties": {"criteria": _COMPARISON_OPERATOR, "value": value},
+    }
+
+
+def _campaign_id_schema(description: str) -> dict[str, Any]:
+    """Input schema for tools whose only argument is a campaign_id."""
+    return {
+        "type": "object",
+        "properties": {
+            "campaign_id": {
+                "type": "integer",
+                "description": description,
+            },
+        },
+        "required": ["campaign_id"],
+        "additionalProperties": False,
+    }
+
+
+_TIMEZONE_FIRST_STEP = (
+    _REQUIRED_FIRST_STEP
+    + "If using a timezone, you MUST first call C_List_Schedule_Timezones to get all available timezones. "
+    "Use the timezone ID (from the 'id' field, e.g., 'America/New_York') in the schedule, NOT the 'name' field."
+)
+
+
+def _resource_loader(filename: str) -> Callable[[], str]:
+    """Return a cached loader for a markdown resource body stored in ``resources/``."""
+
+    @lru_cache(maxsize=None)
+    def load() -> str:
+        return (_RESOURCE_DIR / filename).read_text(encoding="utf-8")
+
+    return load
+
+
+RESOURCE_DEFINITIONS: Mapping[str, Mapping[str, Any]] = {
     "emailbison-api-reference": {
         "name": "emailbison-api-reference",
         "title": "EmailBison API Reference",
         "uri": "document:emailbison/api-reference",
         "description": (
-            "🚨 REQUIRED READING: Official REST endpoints for managing leads, campaigns, senders, and more. "
+            _REQUIRED_READING + "Official REST endpoints for managing leads, campaigns, senders, and more. "
             "MUST be read before using any tools. Contains essential information about filter parameters, "
             "query formats, and endpoint behavior. Useful for inspecting supported query parameters (e.g., pagination, interested flag)."
         ),
         "mime_type": "text/markdown",
-        "content": (
-            "# EmailBison API Reference\n"
-            "\n"
-            "- Base URL: `https://send.longrun.agency/api`\n"
-            "\n"
-            "**Filter Parameters:**\n"
-            "- ALL endpoints (GET and POST) use request body for filters\n"
-            "\n"
-            "- Leads endpoint: `GET /leads` - Filter parameters (`status`, `interested`, `tag_ids`, "
-            "`page`, `per_page`, `filters`) are sent in the request body.\n"
-            "- Campaigns endpoint: `GET /campaigns` - Filter parameters (`search`, `status`, `tag_ids`, `page`, "
-            "`per_page`, `filters`) are sent in the request body. Always retrieve tag IDs via `list_tags` before filtering campaigns.\n"
-            "- Create Campaign endpoint: `POST /campaigns` - Requires 'name' field in request body (this is for creating, not listing).\n"
-            "- Campaign replies: `POST /campaigns/{id}/replies` - Filter parameters are sent in the request body.\n"
-            "- Campaign leads: `GET /campaigns/{id}/leads` - Filter parameters are sent in the request body.\n"
-            "\n"
-            "Refer to the hosted documentation for complete schemas: https://send.longrun.agency/api/reference\n"
-        ),
+        "content_loader": _resource_loader("api-reference.md"),
     },
     "emailbison-mcp-variables": {
         "name": "emailbison-mcp-variables",
         "title": "EmailBison MCP Configuration",
         "uri": "document:emailbison/mcp-variables",
         "description": (
-            "🚨 REQUIRED READING: Configuration options for the EmailBison MCP server. "
+            _REQUIRED_READING + "Configuration options for the EmailBison MCP server. "
             "Supports both multi-account mode (config.json) and single-account mode (environment variables)."
         ),
         "mime_type": "text/markdown",
-        "content": (
-            "# EmailBison MCP Configuration\n"
-            "\n"
-            "## Multi-Account Mode (Recommended)\n"
-            "\n"
-            "The server supports multiple accounts via `config.json` file located in the server directory.\n"
-            "\n"
-            "See `document:emailbison/multi-account-config` for details on setting up `config.json`.\n"
-            "\n"
-            "## Single-Account Mode (Backward Compatible)\n"
-            "\n"
-            "If `config.json` is not found, the server falls back to environment variables:\n"
-            "\n"
-            "- `EMAILBISON_API_KEY`: Workspace API key with access to leads, campaigns, and sending.\n"
-            "- `EMAILBISON_BASE_URL`: Overrides the REST base URL (defaults to `https://send.longrun.agency/api`).\n"
-            "- `EMAILBISON_TIMEOUT_SECONDS`: Optional request timeout override (defaults to `30`).\n"
-            "\n"
-            "Set these variables before launching the MCP server so Claude can authenticate with EmailBison.\n"
-            "\n"
-            "## Using Multiple Accounts\n"
-            "\n"
-            "When using multi-account mode, you can specify which account/workspace to use for each tool call by including "
-            "the `client_name` parameter in tool arguments. Each API key is automatically associated with its workspace, "
-            "so no workspace switching is needed - just use the correct `client_name` and the right API key will be used. "
-            "If not specified, the default client from config.json is used.\n"
-        ),
+        "content_loader": _resource_loader("mcp-variables.md"),
     },
     "emailbison-multi-account-config": {
         "name": "emailbison-multi-account-config",
         "title": "Multi-Account Configuration",
         "uri": "document:emailbison/multi-account-config",
         "description": (
-            "🚨 REQUIRED READING: Guide for setting up multiple EmailBison accounts in config.json. "
+            _REQUIRED_READING + "Guide for setting up multiple EmailBison accounts in config.json. "
             "MUST be read before using multi-account functionality."
         ),
         "mime_type": "text/markdown",
-        "content": (
-            "# Multi-Account Configuration Guide\n"
-            "\n"
-            "The EmailBison MCP server supports managing multiple accounts through a `config.json` file.\n"
-            "\n"
-            "## Configuration File Location\n"
-            "\n"
-            "Create a `config.json` file in the same directory as the server (`emailbison_mcp/`).\n"
-            "\n"
-            "## Configuration Structure\n"
-            "\n"
-            "```json\n"
-            "{\n"
-            "  \"clients\": {\n"
-            "    \"ClientName1\": {\n"
-            "      \"mcp_key\": \"api-key-for-client-1\",\n"
-            "      \"mcp_url\": \"https://send.longrun.agency/api\"\n"
-            "    },\n"
-            "    \"ClientName2\": {\n"
-            "      \"mcp_key\": \"api-key-for-client-2\",\n"
-            "      \"mcp_url\": \"\"\n"
-            "    }\n"
-            "  },\n"
-            "  \"default_client\": \"ClientName1\"\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### Fields\n"
-            "\n"
-            "- **`clients`** (required): Object containing account configurations\n"
-            "  - Each key is a unique client/account name\n"
-            "  - Each value is a configuration object with:\n"
-            "    - **`mcp_key`** (required): API key for this account\n"
-            "    - **`mcp_url`** (optional): Base URL override (empty string uses default)\n"
-            "- **`default_client`** (optional): Name of the default client to use when `client_name` is not specified\n"
-            "\n"
-            "## Using Accounts in Tools\n"
-            "\n"
-            "All tools accept an optional `client_name` parameter. Each API key is automatically associated with its workspace, "
-            "so specifying `client_name` uses that workspace's API key - no workspace switching needed.\n"
-            "\n"
-            "**CRITICAL: DO NOT use W_List_Workspaces or W_Switch_Workspace to access different workspaces.** "
-            "Just use the `client_name` parameter:\n"
-            "\n"
-            "```\n"
-            "# Access ATI workspace\n"
-            "C_List_Campaigns(client_name=\"ATI\", page=1, per_page=50)\n"
-            "\n"
-            "# Access LongRun workspace\n"
-            "C_List_Campaigns(client_name=\"LongRun\", page=1, per_page=50)\n"
-            "```\n"
-            "\n"
-            "If `client_name` is not provided, the `default_client` from config.json is used. "
-            "Each client's API key automatically accesses its associated workspace. "
-            "Workspace switching tools (W_List_Workspaces, W_Switch_Workspace) are only for managing workspaces within a single account, not for accessing different accounts.\n"
-            "\n"
-            "## Security\n"
-            "\n"
-            "- **Never commit `config.json` to version control**\n"
-            "- Keep API keys secure\n"
-            "- Restrict file system access to config.json\n"
-        ),
+        "content_loader": _resource_loader("multi-account-config.md"),
     },
     "emailbison-account-details": {
         "name": "emailbison-account-details",
         "title": "Account Details Endpoint",
         "uri": "document:emailbison/account-details",
         "description": (
-            "🚨 REQUIRED READING: Reference for retrieving the authenticated user's account and team information. "
+            _REQUIRED_READING + "Reference for retrieving the authenticated user's account and team information. "
             "MUST be read before using account-related tools."
         ),
         "mime_type": "text/markdown",
-        "content": (
-            "# Account Details Endpoint\n"
-            "\n"
-            "- Endpoint: `GET /users`\n"
-            "- Requires: Bearer token in `Authorization` header\n"
-            "- Returns: User id, name, email, profile photo, and nested team limits (sender email limit, warmup limit, etc.)\n"
-            "\n"
-            "Example usage:\n"
-            "```\n"
-            "curl https://send.longrun.agency/api/users \\\n"
-            "  --header 'Authorization: Bearer <TOKEN>'\n"
-            "```\n"
-        ),
+        "content_loader": _resource_loader("account-details.md"),
     },
     "emailbison-tags": {
         "name": "emailbison-tags",
         "title": "Workspace Tags Endpoint",
         "uri": "document:emailbison/tags",
         "description": (
-            "🚨 REQUIRED READING: Reference for listing workspace tags and using their IDs for filtering leads. "
+            _REQUIRED_READING + "Reference for listing workspace tags and using their IDs for filtering leads. "
             "MUST be read before filtering leads or campaigns by tags."
         ),
         "mime_type": "text/markdown",
-        "content": (
-            "# Tags Endpoint\n"
-            "\n"
-            "- Endpoint: `GET /tags`\n"
-            "- Returns: `id`, `name`, `default`, and timestamps for every tag in the workspace.\n"
-            "- Usage: When filtering leads, always supply the tag **ID** in `tag_ids` rather than the name.\n"
-            "\n"
-            "Example usage:\n"
-            "```\n"
-            "curl https://send.longrun.agency/api/tags \\\n"
-            "  --header 'Authorization: Bearer <TOKEN>'\n"
-            "```\n"
-        ),
+        "content_loader": _resource_loader("tags.md"),
     },
     "emailbison-filters": {
         "name": "emailbison-filters",
         "title": "EmailBison Filtering Guide",
         "uri": "document:emailbison/filters",
         "description": (
-            "🚨 CRITICAL REQUIRED READING: Complete guide to filtering leads, campaigns, and other entities. "
+            _CRITICAL_REQUIRED_READING + "Complete guide to filtering leads, campaigns, and other entities. "
             "MUST be read before using any filtering operations. All filtering (including tags) is done by putting filters into the request body."
         ),
         "mime_type": "text/markdown",
-        "content": (
-            "# EmailBison Filtering Guide\n"
-            "\n"
-            "**CRITICAL: All filtering and tag usage is done by putting filters into the BODY of the request.**\n"
-            "\n"
-            "## Important Notes\n"
-            "\n"
-            "- **ALL endpoints (GET and POST) use request body for filters**\n"
-            "- Filters are sent as a nested object in the request body under the `filters` key\n"
-            "- Tags are filtered using `filters.tag_ids` (array of tag IDs, not names)\n"
-            "- Always retrieve tag IDs via `list_tags` before filtering by tags\n"
-            "\n"
-            "## Filter Structure\n"
-            "\n"
-            "Filters are provided as a nested object in the request body:\n"
-            "\n"
-            "```json\n"
-            "{\n"
-            "  \"page\": 1,\n"
-            "  \"per_page\": 15,\n"
-            "  \"filters\": {\n"
-            "    \"lead_campaign_status\": \"in_sequence\",\n"
-            "    \"tag_ids\": [1, 2, 3],\n"
-            "    \"emails_sent\": {\n"
-            "      \"criteria\": \">=\",\n"
-            "      \"value\": 5\n"
-            "    }\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "## Available Filter Options\n"
-            "\n"
-            "### 1. Lead Campaign Status\n"
-            "\n"
-            "- **Key**: `filters.lead_campaign_status`\n"
-            "- **Type**: `string`\n"
-            "- **Values**: One of:\n"
-            "  - `in_sequence` - Lead is currently in an email sequence\n"
-            "  - `sequence_finished` - Lead has completed the sequence\n"
-            "  - `sequence_stopped` - Sequence was stopped for this lead\n"
-            "  - `never_contacted` - Lead has never been contacted\n"
-            "  - `replied` - Lead has replied to emails\n"
-            "\n"
-            "**Example:**\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"lead_campaign_status\": \"replied\"\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 2. Emails Sent\n"
-            "\n"
-            "- **Key**: `filters.emails_sent`\n"
-            "- **Type**: `object` with `criteria` and `value`\n"
-            "- **criteria**: Comparison operator - One of: `=`, `>=`, `>`, `<=`, `<`\n"
-            "- **value**: `integer | null` - Number of emails sent\n"
-            "\n"
-            "**Example:** Filter leads with 5 or more emails sent\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"emails_sent\": {\n"
-            "      \"criteria\": \">=\",\n"
-            "      \"value\": 5\n"
-            "    }\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 3. Email Opens\n"
-            "\n"
-            "- **Key**: `filters.opens`\n"
-            "- **Type**: `object` with `criteria` and `value`\n"
-            "- **criteria**: Comparison operator - One of: `=`, `>=`, `>`, `<=`, `<`\n"
-            "- **value**: `integer | null` - Number of email opens\n"
-            "\n"
-            "**Example:** Filter leads with more than 10 opens\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"opens\": {\n"
-            "      \"criteria\": \">\",\n"
-            "      \"value\": 10\n"
-            "    }\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 4. Replies\n"
-            "\n"
-            "- **Key**: `filters.replies`\n"
-            "- **Type**: `object` with `criteria` and `value`\n"
-            "- **criteria**: Comparison operator - One of: `=`, `>=`, `>`, `<=`, `<`\n"
-            "- **value**: `integer | null` - Number of replies\n"
-            "\n"
-            "**Example:** Filter leads with at least 1 reply\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"replies\": {\n"
-            "      \"criteria\": \">=\",\n"
-            "      \"value\": 1\n"
-            "    }\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 5. Verification Statuses\n"
-            "\n"
-            "- **Key**: `filters.verification_statuses`\n"
-            "- **Type**: `array` of `string`\n"
-            "- **Values**: One or more of:\n"
-            "  - `verifying` - Email is being verified\n"
-            "  - `verified` - Email is verified\n"
-            "  - `risky` - Email is marked as risky\n"
-            "  - `unknown` - Verification status is unknown\n"
-            "  - `unverified` - Email is not verified\n"
-            "  - `inactive` - Email is inactive\n"
-            "  - `bounced` - Email has bounced\n"
-            "  - `unsubscribed` - Lead has unsubscribed\n"
-            "\n"
-            "**Example:** Filter verified and risky leads\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"verification_statuses\": [\"verified\", \"risky\"]\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 6. Tag IDs (Inclusion)\n"
-            "\n"
-            "- **Key**: `filters.tag_ids`\n"
-            "- **Type**: `array` of `integer`\n"
-            "- **Description**: Filter by tag IDs. Only leads/campaigns with these tags will be returned.\n"
-            "- **Important**: You MUST call `list_tags` first to get tag IDs (not names)\n"
-            "\n"
-            "**Example:** Filter leads with tag IDs 1, 5, and 10\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"tag_ids\": [1, 5, 10]\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 7. Excluded Tag IDs\n"
-            "\n"
-            "- **Key**: `filters.excluded_tag_ids`\n"
-            "- **Type**: `array` of `integer`\n"
-            "- **Description**: Exclude leads/campaigns by tag IDs. Leads/campaigns with these tags will be excluded from results.\n"
-            "\n"
-            "**Example:** Exclude leads with tag IDs 2 and 3\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"excluded_tag_ids\": [2, 3]\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 8. Without Tags\n"
-            "\n"
-            "- **Key**: `filters.without_tags`\n"
-            "- **Type**: `boolean`\n"
-            "- **Description**: Only show leads/campaigns that have no tags attached.\n"
-            "\n"
-            "**Example:** Show only leads without any tags\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"without_tags\": true\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 9. Created At Date\n"
-            "\n"
-            "- **Key**: `filters.created_at`\n"
-            "- **Type**: `object` with `criteria` and `value`\n"
-            "- **criteria**: Comparison operator - One of: `=`, `>=`, `>`, `<=`, `<`\n"
-            "- **value**: `string | null` - Date in `YYYY-MM-DD` format\n"
-            "\n"
-            "**Example:** Filter leads created on or after 2024-01-01\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"created_at\": {\n"
-            "      \"criteria\": \">=\",\n"
-            "      \"value\": \"2024-01-01\"\n"
-            "    }\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "### 10. Updated At Date\n"
-            "\n"
-            "- **Key**: `filters.updated_at`\n"
-            "- **Type**: `object` with `criteria` and `value`\n"
-            "- **criteria**: Comparison operator - One of: `=`, `>=`, `>`, `<=`, `<`\n"
-            "- **value**: `string | null` - Date in `YYYY-MM-DD` format\n"
-            "\n"
-            "**Example:** Filter leads updated before 2024-12-31\n"
-            "```json\n"
-            "{\n"
-            "  \"filters\": {\n"
-            "    \"updated_at\": {\n"
-            "      \"criteria\": \"<\",\n"
-            "      \"value\": \"2024-12-31\"\n"
-            "    }\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "## Combining Multiple Filters\n"
-            "\n"
-            "You can combine multiple filters in a single request. All filters are applied together (AND logic):\n"
-            "\n"
-            "**Example:** Find leads that:\n"
-            "- Are in sequence\n"
-            "- Have tag ID 5\n"
-            "- Have sent 3 or more emails\n"
-            "- Were created after 2024-01-01\n"
-            "\n"
-            "```json\n"
-            "{\n"
-            "  \"page\": 1,\n"
-            "  \"per_page\": 15,\n"
-            "  \"filters\": {\n"
-            "    \"lead_campaign_status\": \"in_sequence\",\n"
-            "    \"tag_ids\": [5],\n"
-            "    \"emails_sent\": {\n"
-            "      \"criteria\": \">=\",\n"
-            "      \"value\": 3\n"
-            "    },\n"
-            "    \"created_at\": {\n"
-            "      \"criteria\": \">\",\n"
-            "      \"value\": \"2024-01-01\"\n"
-            "    }\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "## Tag Filtering Workflow\n"
-            "\n"
-            "**CRITICAL: Always get tag IDs before filtering by tags.**\n"
-            "\n"
-            "1. Call `T_List_Tags` to get all available tags\n"
-            "2. Find the tag(s) you need and extract their `id` values\n"
-            "3. Use those IDs in `filters.tag_ids` array\n"
-            "\n"
-            "**Example Workflow:**\n"
-            "\n"
-            "```\n"
-            "Step 1: Call T_List_Tags\n"
-            "Response: [\n"
-            "  {\"id\": 1, \"name\": \"Google\"},\n"
-            "  {\"id\": 2, \"name\": \"Facebook\"},\n"
-            "  {\"id\": 3, \"name\": \"LinkedIn\"}\n"
-            "]\n"
-            "\n"
-            "Step 2: Filter leads with tag 'Google' (ID: 1)\n"
-            "Request body: {\n"
-            "  \"filters\": {\n"
-            "    \"tag_ids\": [1]\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "## Comparison Operators\n"
-            "\n"
-            "For numeric and date filters, use these comparison operators:\n"
-            "\n"
-            "- `=` - Equal to\n"
-            "- `>=` - Greater than or equal to\n"
-            "- `>` - Greater than\n"
-            "- `<=` - Less than or equal to\n"
-            "- `<` - Less than\n"
-            "\n"
-            "## Date Format\n"
-            "\n"
-            "All date values must be in `YYYY-MM-DD` format:\n"
-            "\n"
-            "- ✅ Correct: `\"2024-01-15\"`\n"
-            "- ❌ Wrong: `\"01/15/2024\"`\n"
-            "- ❌ Wrong: `\"2024-1-15\"` (missing zero padding)\n"
-            "\n"
-            "## Summary\n"
-            "\n"
-            "- **All filters go in the request body** under the `filters` key\n"
-            "- **Tags are filtered using `filters.tag_ids`** (array of integers)\n"
-            "- **Always get tag IDs first** using `list_tags`\n"
-            "- **Combine multiple filters** by including them all in the `filters` object\n"
-            "- **Use comparison operators** (`=`, `>=`, `>`, `<=`, `<`) for numeric and date filters\n"
-            "- **Date format must be YYYY-MM-DD**\n"
-        ),
+        "content_loader": _resource_loader("filters.md"),
     },
     "emailbison-pagination": {
         "name": "emailbison-pagination",
         "title": "EmailBison Pagination Guide",
         "uri": "document:emailbison/pagination",
         "description": (
-            "🚨 CRITICAL REQUIRED READING: Guide for handling paginated API responses. "
+            _CRITICAL_REQUIRED_READING + "Guide for handling paginated API responses. "
             "MUST be read before using any data-fetching tools. Contains essential pagination requirements "
             "and workflows. Always use pagination when fetching data."
         ),
         "mime_type": "text/markdown",
-        "content": (
-            "# Pagination Guide\n"
-            "\n"
-            "**IMPORTANT: Always use pagination when fetching data from EmailBison API.**\n"
-            "\n"
-            "## Overview\n"
-            "\n"
-            "Many API endpoints return paginated responses to handle large datasets efficiently. "
-            "Responses are broken into pages of 15 entries per page by default.\n"
-            "\n"
-            "## Response Structure\n"
-            "\n"
-            "Paginated responses include:\n"
-            "\n"
-            "- `data`: Array of entries for the current page\n"
-            "- `links`: Navigation links for pagination\n"
-            "  - `first`: URL to the first page\n"
-            "  - `last`: URL to the last page\n"
-            "  - `prev`: URL to the previous page (null if on first page)\n"
-            "  - `next`: URL to the next page (null if on last page)\n"
-            "- `meta`: Pagination metadata\n"
-            "  - `current_page`: Current page number\n"
-            "  - `from`: Starting entry number\n"
-            "  - `last_page`: Total number of pages\n"
-            "\n"
-            "## How to Use Pagination\n"
-            "\n"
-            "### Method 1: Using `links.next`\n"
-            "\n"
-            "1. Send a request to the paginated endpoint\n"
-            "2. Process the data in the `data` field\n"
-            "3. If `links.next` is not null, send a request to that URL to get the next page\n"
-            "4. Repeat until `links.next` is null\n"
-            "\n"
-            "### Method 2: Using `page` Parameter\n"
-            "\n"
-            "1. Start with `page=1`\n"
-            "2. Process the data in the `data` field\n"
-            "3. Increment the page number: `page=2`, `page=3`, etc.\n"
-            "4. Continue until you reach `meta.last_page`\n"
-            "\n"
-            "## Example Request\n"
-            "\n"
-            "```\n"
-            "GET /api/leads?page=1&per_page=15\n"
-            "```\n"
-            "\n"
-            "## Example Response\n"
-            "\n"
-            "```json\n"
-            "{\n"
-            "  \"data\": [...],\n"
-            "  \"links\": {\n"
-            "    \"first\": \"https://send.longrun.agency/api/leads?page=1\",\n"
-            "    \"last\": \"https://send.longrun.agency/api/leads?page=4\",\n"
-            "    \"prev\": null,\n"
-            "    \"next\": \"https://send.longrun.agency/api/leads?page=2\"\n"
-            "  },\n"
-            "  \"meta\": {\n"
-            "    \"current_page\": 1,\n"
-            "    \"from\": 1,\n"
-            "    \"last_page\": 4\n"
-            "  }\n"
-            "}\n"
-            "```\n"
-            "\n"
-            "## Endpoints with Pagination\n"
-            "\n"
-            "The following endpoints support pagination:\n"
-            "\n"
-            "- `list_leads` - Always paginated (GET with query parameters)\n"
-            "- `list_campaigns` - Always paginated (GET with query parameters)\n"
-            "- `get_campaign_replies` - Always paginated (POST with body parameters)\n"
-            "- `get_campaign_leads` - Always paginated (GET with query parameters)\n"
-            "\n"
-            "## Critical Pagination Workflow\n"
-            "\n"
-            "**When a user asks for 'first 15', 'all leads', or any quantity of results:**\n"
-            "\n"
-            "1. **ALWAYS start with page=1** - Fetch the first page\n"
-            "2. **ALWAYS check pagination metadata** - Look for `meta.last_page` or `links.next`\n"
-            "3. **ALWAYS fetch additional pages if needed** - If `meta.last_page > 1`, you MUST fetch pages 2, 3, etc.\n"
-            "4. **ALWAYS combine results** - Merge results from all pages before responding\n"
-            "5. **NEVER assume page 1 has all results** - Even if page 1 has results, check if more pages exist\n"
-            "\n"
-            "## Example Workflow: Getting 'First 15 Leads with Tag X'\n"
-            "\n"
-            "```\n"
-            "Step 1: Call list_tags to find tag ID for 'Google'\n"
-            "Step 2: Call list_leads with tag_ids=[google_tag_id], page=1\n"
-            "Step 3: Check response:\n"
-            "  - If meta.last_page = 1: You have all results, return first 15\n"
-            "  - If meta.last_page > 1: You MUST fetch additional pages\n"
-            "Step 4: If more pages exist, call list_leads with page=2, page=3, etc.\n"
-            "Step 5: Combine all results from all pages\n"
-            "Step 6: Return the first 15 names from the combined results\n"
-            "```\n"
-            "\n"
-            "## Best Practices\n"
-            "\n"
-            "1. **Always check pagination metadata first** - Don't assume you have all results\n"
-            "2. **Handle edge cases** - Empty results, single-page results, API errors\n"
-            "3. **Use appropriate page sizes** - Default is 15 per page, can be adjusted with `per_page` parameter\n"
-            "4. **Combine results systematically** - Fetch all pages before filtering or limiting results\n"
-            "5. **Log pagination progress** - Track which pages have been fetched\n"
-            "\n"
-            "**Remember: The API ALWAYS returns paginated results. You MUST check for and fetch additional pages!**\n"
-        ),
+        "content_loader": _resource_loader("pagination.md"),
     },
     "emailbison-entity-ids": {
         "name": "emailbison-entity-ids",
         "title": "Entity ID Requirements Guide",
         "uri": "document:emailbison/entity-ids",
         "description": (
-            "🚨 CRITICAL REQUIRED READING: Guide for working with entity IDs. "
+            _CRITICAL_REQUIRED_READING + "Guide for working with entity IDs. "
             "MUST be read before filtering or searching by any entities. "
             "The API requires IDs (not names) for tags, timezones, schedules, campaigns, leads, sender emails, and workspaces."
         ),
         "mime_type": "text/markdown",
-        "content": (
-            "# Entity ID Requirements Guide\n"
-            "\n"
-            "**CRITICAL: The EmailBison API requires IDs (not names) for most entity references.**\n"
-            "\n"
-            "## Required Workflow\n"
-            "\n"
-            "**BEFORE filtering, searching, or referencing any entity, you MUST first list all available entities to get their IDs.**\n"
-            "\n"
-            "### Step-by-Step Process:\n"
-            "\n"
-            "1. **List the entity type** - Call the appropriate list tool to get all available entities\n"
-            "2. **Extract the ID** - Find the entity you need and get its `id` field\n"
-            "3. **Use the ID** - Use the ID (not the name) in your filter or operation\n"
-            "\n"
-            "## Entities That Require IDs\n"
-            "\n"
-            "### Tags (tag_ids)\n"
-            "- **List tool**: `T_List_Tags`\n"
-            "- **Used in**: Filtering leads, campaigns, sender emails\n"
-            "- **Example**: To filter leads by tag 'Google':\n"
-            "  1. Call `T_List_Tags` to get all tags\n"
-            "  2. Find the tag with name 'Google' and get its `id`\n"
-            "  3. Use that `id` in `tag_ids` parameter when filtering\n"
-            "\n"
-            "### Timezones (timezone id)\n"
-            "- **List tool**: `C_List_Schedule_Timezones`\n"
-            "- **Used in**: Creating or updating campaign schedules\n"
-            "- **Example**: To create a schedule with timezone 'America/New_York':\n"
-            "  1. Call `C_List_Schedule_Timezones` to get all timezones\n"
-            "  2. Find the timezone with name containing 'New York' and get its `id` field\n"
-            "  3. Use that `id` (e.g., 'America/New_York') in the schedule\n"
-            "\n"
-            "### Schedule Templates (schedule_id)\n"
-            "- **List tool**: `C_List_Schedule_Templates`\n"
-            "- **Used in**: Creating campaign schedules from templates\n"
-            "- **Example**: To create a schedule from a template:\n"
-            "  1. Call `C_List_Schedule_Templates` to get all templates\n"
-            "  2. Find the template you need and get its `id`\n"
-            "  3. Use that `id` in `schedule_id` parameter\n"
-            "\n"
-            "### Campaigns (campaign_id)\n"
-            "- **List tool**: `C_List_Campaigns`\n"
-            "- **Used in**: Most campaign-related operations\n"
-            "- **Example**: To get leads for a campaign named 'Sales Campaign':\n"
-            "  1. Call `C_List_Campaigns` to get all campaigns\n"
-            "  2. Find the campaign with name 'Sales Campaign' and get its `id`\n"
-            "  3. Use that `id` in `campaign_id` parameter\n"
-            "\n"
-            "### Leads (lead_id)\n"
-            "- **List tool**: `L_List_Leads`\n"
-            "- **Used in**: Lead operations, filtering replies\n"
-            "- **Example**: To get a specific lead's details:\n"
-            "  1. Call `L_List_Leads` to find the lead\n"
-            "  2. Get the lead's `id` from the response\n"
-            "  3. Use that `id` in `lead_id` parameter\n"
-            "\n"
-            "### Sender Emails (sender_email_id)\n"
-            "- **List tool**: `M_List_Sender_Emails`\n"
-            "- **Used in**: Email operations, filtering replies\n"
-            "- **Example**: To send an email from a specific sender:\n"
-            "  1. Call `M_List_Sender_Emails` to get all sender emails\n"
-            "  2. Find the sender email you need and get its `id`\n"
-            "  3. Use that `id` in `sender_email_id` parameter\n"
-            "\n"
-            "### Workspaces (team_id)\n"
-            "- **List tool**: `W_List_Workspaces`\n"
-            "- **Used in**: Workspace operations\n"
-            "- **Example**: To access a different workspace, use `client_name` parameter in tools (e.g., `client_name=\"ATI\"`). "
-            "Workspace switching tools are only for managing workspaces within a single account, not for accessing different accounts.\n"
-            "\n"
-            "### Custom Variables\n"
-            "- **List tool**: `W_List_Custom_Variables`\n"
-            "- **Used in**: Lead creation/updates\n"
-            "- **Example**: To use a custom variable in a lead:\n"
-            "  1. Call `W_List_Custom_Variables` to see available variables\n"
-            "  2. Use the variable `name` (not ID) in `custom_variables` array\n"
-            "\n"
-            "## Common Mistakes to Avoid\n"
-            "\n"
-            "❌ **DON'T**: Use entity names directly in filters\n"
-            "✅ **DO**: Always list entities first, then use their IDs\n"
-            "\n"
-            "❌ **DON'T**: Assume you know the ID\n"
-            "✅ **DO**: Always fetch the current list of entities\n"
-            "\n"
-            "❌ **DON'T**: Use names like 'Google' in tag_ids\n"
-            "✅ **DO**: List tags, find 'Google', use its ID\n"
-            "\n"
-            "## Workflow Example: Filter Leads by Tag\n"
-            "\n"
-            "```\n"
-            "Step 1: Call T_List_Tags to get all tags\n"
-            "Step 2: Find tag with name 'Important' → ID is 5\n"
-            "Step 3: Call L_List_Leads with tag_ids=[5] (NOT tag_ids=['Important'])\n"
-            "```\n"
-            "\n"
-            "## Workflow Example: Create Schedule with Timezone\n"
-            "\n"
-            "```\n"
-            "Step 1: Call C_List_Schedule_Timezones to get all timezones\n"
-            "Step 2: Find timezone 'America/New_York' → ID is 'America/New_York'\n"
-            "Step 3: Use timezone: 'America/New_York' in schedule creation\n"
-            "```\n"
-            "\n"
-            "**Remember: ALWAYS list entities before using them. The API requires IDs, not names!**\n"
-        ),
+        "content_loader": _resource_loader("entity-ids.md"),
     },
 }
 
-RESOURCE_DEFINITIONS_BY_URI = {info["uri"]: info for info in RESOURCE_DEFINITIONS.values()}
+# Freeze the definitions so handlers can share them without defensive copies
+RESOURCE_DEFINITIONS = MappingProxyType(
+    {key: MappingProxyType(info) for key, info in RESOURCE_DEFINITIONS.items()}
+)
+
+RESOURCE_DEFINITIONS_BY_URI: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {info["uri"]: info for info in RESOURCE_DEFINITIONS.values()}
+)
+
+RESOURCES: list[types.Resource] = [
+    types.Resource(
+        name=info["name"],
+        uri=info["uri"],
+        description=info["description"],
+        mimeType=info["mime_type"],
+        title=info["title"],
+    )
+    for info in RESOURCE_DEFINITIONS.values()
+]
 
 PROMPT_DEFINITIONS: dict[str, types.Prompt] = {
     "list-interested-leads": types.Prompt(
@@ -971,22 +491,12 @@ PROMPT_DEFINITIONS: dict[str, types.Prompt] = {
     ),
 }
 
-TOOL_DEFINITIONS: list[types.Tool] = [
+TOOL_DEFINITIONS: tuple[types.Tool, ...] = (
     types.Tool(
         name="C_Archive_Campaign",
         title="C. Archive Campaign",
         description="Archive a campaign by ID.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "campaign_id": {
-                    "type": "integer",
-                    "description": "ID of the campaign to archive.",
-                }
-            },
-            "required": ["campaign_id"],
-            "additionalProperties": False,
-        },
+        inputSchema=_campaign_id_schema("ID of the campaign to archive."),
     ),
     types.Tool(
         name="C_Attach_Sender_Emails_To_Campaign",
@@ -1040,8 +550,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="C. Create Campaign Schedule",
         description=(
             "Define allowable send days and times for a campaign. "
-            "🚨 REQUIRED FIRST STEP: If using a timezone, you MUST first call C_List_Schedule_Timezones to get all available timezones. "
-            "Use the timezone ID (from the 'id' field, e.g., 'America/New_York') in the schedule, NOT the 'name' field."
+            + _TIMEZONE_FIRST_STEP
         ),
         inputSchema={
             "type": "object",
@@ -1080,8 +589,8 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="C. Create Campaign Schedule From Template",
         description=(
             "Create a campaign schedule using a saved schedule template. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call C_List_Schedule_Templates to get all available templates and their IDs. "
-            "Use the template ID (not name) in the schedule_id parameter."
+            + _first_step("C_List_Schedule_Templates", "get all available templates and their IDs")
+            + "Use the template ID (not name) in the schedule_id parameter."
         ),
         inputSchema={
             "type": "object",
@@ -1198,45 +707,25 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="C_Duplicate_Campaign",
         title="C. Duplicate Campaign",
         description="Create a copy of an existing campaign by ID.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "campaign_id": {
-                    "type": "integer",
-                    "description": "ID of the campaign to duplicate.",
-                }
-            },
-            "required": ["campaign_id"],
-            "additionalProperties": False,
-        },
+        inputSchema=_campaign_id_schema("ID of the campaign to duplicate."),
     ),
     types.Tool(
         name="C_Get_Campaign_Details",
         title="C. Get Campaign Details",
         description=(
             "Retrieve the details of a specific campaign. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call C_List_Campaigns to find the campaign and get its ID. "
-            "Returns comprehensive information including campaign ID, UUID, name, type, status, completion percentage, email statistics (sent, opened, replied, bounced, unsubscribed, interested), lead counts, settings (max emails per day, plain text, open tracking, unsubscribe settings), timestamps, and associated tags."
+            + _first_step("C_List_Campaigns", "find the campaign and get its ID")
+            + "Returns comprehensive information including campaign ID, UUID, name, type, status, completion percentage, email statistics (sent, opened, replied, bounced, unsubscribed, interested), lead counts, settings (max emails per day, plain text, open tracking, unsubscribe settings), timestamps, and associated tags."
         ),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "campaign_id": {
-                    "type": "integer",
-                    "description": "ID of the campaign to retrieve details for.",
-                },
-            },
-            "required": ["campaign_id"],
-            "additionalProperties": False,
-        },
+        inputSchema=_campaign_id_schema("ID of the campaign to retrieve details for."),
     ),
     types.Tool(
         name="C_Get_Campaign_Leads",
         title="C. Get Campaign Leads",
         description=(
             "Retrieve all leads associated with a campaign. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call C_List_Campaigns to find the campaign and get its ID. "
-            "If filtering by tags, you MUST first call T_List_Tags to get tag IDs (not names). "
+            + _first_step("C_List_Campaigns", "find the campaign and get its ID")
+            + "If filtering by tags, you MUST first call T_List_Tags to get tag IDs (not names). "
             "Returns paginated results (15 per page by default). Uses GET request with body for filters. "
             "Supports filtering by search term and complex filters for status, emails sent, opens, replies, verification statuses, tags, and dates. "
             "CRITICAL: This endpoint ALWAYS returns paginated results. You MUST check the response for 'links.next' or 'meta.last_page' to determine if there are more pages. "
@@ -1254,6 +743,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                     "description": "Page number to retrieve (default: 1). Use pagination to fetch all data.",
                     "default": 1,
                 },
+                "all_pages": _ALL_PAGES_PROPERTY,
                 "per_page": {
                     "type": "integer",
                     "description": "Number of results per page (default: 15).",
@@ -1272,51 +762,18 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                             "enum": ["in_sequence", "sequence_finished", "sequence_stopped", "never_contacted", "replied"],
                             "description": "Filter by lead campaign status.",
                         },
-                        "emails_sent": {
-                            "type": "object",
-                            "description": "Filter by number of emails sent.",
-                            "properties": {
-                                "criteria": {
-                                    "type": "string",
-                                    "enum": ["=", ">=", ">", "<=", "<"],
-                                    "description": "Comparison operator.",
-                                },
-                                "value": {
-                                    "type": "integer",
-                                    "description": "Value for the number of emails sent.",
-                                },
-                            },
-                        },
-                        "opens": {
-                            "type": "object",
-                            "description": "Filter by number of email opens.",
-                            "properties": {
-                                "criteria": {
-                                    "type": "string",
-                                    "enum": ["=", ">=", ">", "<=", "<"],
-                                    "description": "Comparison operator.",
-                                },
-                                "value": {
-                                    "type": "integer",
-                                    "description": "Value for the number of opens.",
-                                },
-                            },
-                        },
-                        "replies": {
-                            "type": "object",
-                            "description": "Filter by number of replies.",
-                            "properties": {
-                                "criteria": {
-                                    "type": "string",
-                                    "enum": ["=", ">=", ">", "<=", "<"],
-                                    "description": "Comparison operator.",
-                                },
-                                "value": {
-                                    "type": "integer",
-                                    "description": "Value for the number of replies.",
-                                },
-                            },
-                        },
+                        "emails_sent": _comparison_filter(
+                            "Filter by number of emails sent.",
+                            {"type": "integer", "description": "Value for the number of emails sent."},
+                        ),
+                        "opens": _comparison_filter(
+                            "Filter by number of email opens.",
+                            {"type": "integer", "description": "Value for the number of opens."},
+                        ),
+                        "replies": _comparison_filter(
+                            "Filter by number of replies.",
+                            {"type": "integer", "description": "Value for the number of replies."},
+                        ),
                         "verification_statuses": {
                             "type": "array",
                             "items": {
@@ -1339,38 +796,14 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                             "type": "boolean",
                             "description": "Only show leads that have no tags attached.",
                         },
-                        "created_at": {
-                            "type": "object",
-                            "description": "Filter by created_at date.",
-                            "properties": {
-                                "criteria": {
-                                    "type": "string",
-                                    "enum": ["=", ">=", ">", "<=", "<"],
-                                    "description": "Comparison operator.",
-                                },
-                                "value": {
-                                    "type": "string",
-                                    "format": "date",
-                                    "description": "Date value in YYYY-MM-DD format.",
-                                },
-                            },
-                        },
-                        "updated_at": {
-                            "type": "object",
-                            "description": "Filter by updated_at date.",
-                            "properties": {
-                                "criteria": {
-                                    "type": "string",
-                                    "enum": ["=", ">=", ">", "<=", "<"],
-                                    "description": "Comparison operator.",
-                                },
-                                "value": {
-                                    "type": "string",
-                                    "format": "date",
-                                    "description": "Date value in YYYY-MM-DD format.",
-                                },
-                            },
-                        },
+                        "created_at": _comparison_filter(
+                            "Filter by created_at date.",
+                            _DATE_FILTER_VALUE,
+                        ),
+                        "updated_at": _comparison_filter(
+                            "Filter by updated_at date.",
+                            _DATE_FILTER_VALUE,
+                        ),
                     },
                 },
             },
@@ -1409,8 +842,8 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="C. Get Campaign Replies",
         description=(
             "Retrieve all replies associated with a campaign. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call C_List_Campaigns to find the campaign and get its ID. "
-            "If filtering by sender_email_id, you MUST first call M_List_Sender_Emails to get sender email IDs. "
+            + _first_step("C_List_Campaigns", "find the campaign and get its ID")
+            + "If filtering by sender_email_id, you MUST first call M_List_Sender_Emails to get sender email IDs. "
             "If filtering by lead_id, you MUST first call L_List_Leads to get lead IDs. "
             "If filtering by tag_ids, you MUST first call T_List_Tags to get tag IDs (not names). "
             "Returns paginated results (15 per page by default). IMPORTANT: All filter parameters (search, status, folder, read, sender_email_id, lead_id, tag_ids, filters) are sent in the request body, not as query parameters. "
@@ -1429,6 +862,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                     "description": "Page number to retrieve (default: 1). Use pagination to fetch all data.",
                     "default": 1,
                 },
+                "all_pages": _ALL_PAGES_PROPERTY,
                 "per_page": {
                     "type": "integer",
                     "description": "Number of results per page (default: 15).",
@@ -1440,12 +874,12 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                 },
                 "status": {
                     "type": "string",
-                    "enum": ["interested", "automated_reply", "not_automated_reply"],
+                    "enum": _REPLY_STATUSES,
                     "description": "Filter by status.",
                 },
                 "folder": {
                     "type": "string",
-                    "enum": ["inbox", "sent", "spam", "bounced", "all"],
+                    "enum": _REPLY_FOLDERS,
                     "description": "Filter by folder.",
                 },
                 "read": {
@@ -1482,17 +916,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="C_Get_Campaign_Schedule",
         title="C. Get Campaign Schedule",
         description="Read the configured schedule for a campaign.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "campaign_id": {
-                    "type": "integer",
-                    "description": "ID of the campaign whose schedule should be retrieved.",
-                }
-            },
-            "required": ["campaign_id"],
-            "additionalProperties": False,
-        },
+        inputSchema=_campaign_id_schema("ID of the campaign whose schedule should be retrieved."),
     ),
     types.Tool(
         name="C_Get_Campaign_Scheduled_Emails",
@@ -1527,17 +951,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="C_Get_Campaign_Sender_Emails",
         title="C. Get Campaign Sender Emails",
         description="Retrieve all email accounts (sender emails) associated with a campaign. Returns detailed information about each sender email including name, email address, IMAP/SMTP settings, daily limits, status, statistics (emails sent, replies, opens, etc.), and tags.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "campaign_id": {
-                    "type": "integer",
-                    "description": "ID of the campaign to retrieve sender emails for.",
-                },
-            },
-            "required": ["campaign_id"],
-            "additionalProperties": False,
-        },
+        inputSchema=_campaign_id_schema("ID of the campaign to retrieve sender emails for."),
     ),
     types.Tool(
         name="C_Get_Campaign_Sending_Schedule",
@@ -1552,7 +966,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                 },
                 "day": {
                     "type": "string",
-                    "enum": ["today", "tomorrow", "day_after_tomorrow"],
+                    "enum": _SCHEDULED_EMAIL_DAYS,
                     "description": "The day to view the sending schedule for.",
                 },
             },
@@ -1565,20 +979,11 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="C. Get Campaign Sequence Steps",
         description=(
             "View the sequence steps of a campaign, including email subjects, bodies, wait times, and other step details. "
-            "🚨 REQUIRED FIRST STEP: You MUST call this tool FIRST before updating sequence steps to see existing steps and their IDs. "
+            + _REQUIRED_FIRST_STEP
+            + "You MUST call this tool FIRST before updating sequence steps to see existing steps and their IDs. "
             "When updating sequence steps, use the step IDs from this response in the C_Update_Campaign_Sequence_Steps tool."
         ),
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "campaign_id": {
-                    "type": "integer",
-                    "description": "ID of the campaign to view sequence steps for.",
-                },
-            },
-            "required": ["campaign_id"],
-            "additionalProperties": False,
-        },
+        inputSchema=_campaign_id_schema("ID of the campaign to view sequence steps for."),
     ),
     types.Tool(
         name="C_Get_Campaign_Stats",
@@ -1615,7 +1020,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
             "properties": {
                 "day": {
                     "type": "string",
-                    "enum": ["today", "tomorrow", "day_after_tomorrow"],
+                    "enum": _SCHEDULED_EMAIL_DAYS,
                     "description": "The day to view sending schedules for.",
                 },
             },
@@ -1676,7 +1081,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="C_List_Campaigns",
         title="C. List Campaigns",
         description=(
-            "🚨 REQUIRED FIRST STEP: Retrieve campaigns with pagination, optional search, status, and tag filters (use tag IDs). "
+            _REQUIRED_FIRST_STEP + "Retrieve campaigns with pagination, optional search, status, and tag filters (use tag IDs). "
             "MUST be called before using any campaign_id in other operations. "
             "If filtering by tags, you MUST first call T_List_Tags to get tag IDs (not names). "
             "Uses GET request with body for filters. "
@@ -1710,6 +1115,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                     "default": 1,
                     "description": "Page number to load.",
                 },
+                "all_pages": _ALL_PAGES_PROPERTY,
                 "per_page": {
                     "type": "integer",
                     "minimum": 1,
@@ -1730,7 +1136,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="C_List_Schedule_Templates",
         title="C. List Schedule Templates",
         description=(
-            "🚨 REQUIRED FIRST STEP: Retrieve all saved schedule templates for the workspace. "
+            _REQUIRED_FIRST_STEP + "Retrieve all saved schedule templates for the workspace. "
             "MUST be called before using schedule_id in C_Create_Campaign_Schedule_From_Template. "
             "Returns template IDs that are required for creating schedules from templates."
         ),
@@ -1744,7 +1150,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="C_List_Schedule_Timezones",
         title="C. List Schedule Timezones",
         description=(
-            "🚨 REQUIRED FIRST STEP: Retrieve all available timezones for campaign schedules. "
+            _REQUIRED_FIRST_STEP + "Retrieve all available timezones for campaign schedules. "
             "MUST be called before creating or updating campaign schedules. "
             "Use the timezone ID (from the 'id' field, e.g., 'America/New_York') when creating or updating schedules. "
             "Do NOT use the 'name' field - only use the 'id' field."
@@ -1759,17 +1165,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="C_Pause_Campaign",
         title="C. Pause Campaign",
         description="Pause an active campaign by ID.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "campaign_id": {
-                    "type": "integer",
-                    "description": "ID of the campaign to pause.",
-                }
-            },
-            "required": ["campaign_id"],
-            "additionalProperties": False,
-        },
+        inputSchema=_campaign_id_schema("ID of the campaign to pause."),
     ),
     types.Tool(
         name="C_Remove_Campaign_Leads",
@@ -1817,17 +1213,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="C_Resume_Campaign",
         title="C. Resume Campaign",
         description="Resume a paused campaign by ID.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "campaign_id": {
-                    "type": "integer",
-                    "description": "ID of the campaign to resume.",
-                }
-            },
-            "required": ["campaign_id"],
-            "additionalProperties": False,
-        },
+        inputSchema=_campaign_id_schema("ID of the campaign to resume."),
     ),
     types.Tool(
         name="C_Send_Sequence_Step_Test_Email",
@@ -1884,8 +1270,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="C. Update Campaign Schedule",
         description=(
             "Replace the schedule for a campaign. "
-            "🚨 REQUIRED FIRST STEP: If using a timezone, you MUST first call C_List_Schedule_Timezones to get all available timezones. "
-            "Use the timezone ID (from the 'id' field, e.g., 'America/New_York') in the schedule, NOT the 'name' field."
+            + _TIMEZONE_FIRST_STEP
         ),
         inputSchema={
             "type": "object",
@@ -2202,7 +1587,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="L_List_Leads",
         title="L. List Leads",
         description=(
-            "🚨 REQUIRED FIRST STEP: Retrieve a paginated list of all leads for the authenticated user. "
+            _REQUIRED_FIRST_STEP + "Retrieve a paginated list of all leads for the authenticated user. "
             "MUST be called before using any lead_id in other operations. "
             "Supports extensive filtering options including search, status, campaign status, email metrics (sent, opens, replies), verification statuses, tags, and date ranges. "
             "If filtering by tags, you MUST first call T_List_Tags to get tag IDs (not names). "
@@ -2231,6 +1616,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                     "default": 1,
                     "description": "Page number to retrieve. CRITICAL: Always start with page=1, then check 'meta.last_page' in the response. If last_page > 1, you MUST fetch additional pages (page=2, page=3, etc.) to get all results.",
                 },
+                "all_pages": _ALL_PAGES_PROPERTY,
                 "per_page": {
                     "type": "integer",
                     "minimum": 1,
@@ -2347,8 +1733,8 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="R. Compose New Email",
         description=(
             "Send a one-off email in a new email thread. This creates a new email conversation (not a reply to an existing thread). "
-            "🚨 REQUIRED FIRST STEP: You MUST first call M_List_Sender_Emails to get the sender_email_id. "
-            "Returns the sent reply object with full details including ID, subject, message content, recipients, and attachments."
+            + _first_step("M_List_Sender_Emails", "get the sender_email_id")
+            + "Returns the sent reply object with full details including ID, subject, message content, recipients, and attachments."
         ),
         inputSchema={
             "type": "object",
@@ -2384,7 +1770,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                 },
                 "content_type": {
                     "type": "string",
-                    "enum": ["html", "text"],
+                    "enum": _CONTENT_TYPES,
                     "description": "Type of the email content. Use 'html' for HTML emails or 'text' for plain text emails.",
                 },
                 "cc_emails": {
@@ -2440,8 +1826,8 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="R. Create Reply",
         description=(
             "Reply to an existing email thread. This creates a reply to a specific email conversation. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call M_List_Sender_Emails to get the sender_email_id. "
-            "Returns the sent reply object with full details including ID, subject, message content, recipients, and attachments."
+            + _first_step("M_List_Sender_Emails", "get the sender_email_id")
+            + "Returns the sent reply object with full details including ID, subject, message content, recipients, and attachments."
         ),
         inputSchema={
             "type": "object",
@@ -2477,7 +1863,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                 },
                 "content_type": {
                     "type": "string",
-                    "enum": ["html", "text"],
+                    "enum": _CONTENT_TYPES,
                     "description": "Type of the email content. Use 'html' for HTML emails or 'text' for plain text emails.",
                 },
                 "cc_emails": {
@@ -2549,12 +1935,12 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                 },
                 "status": {
                     "type": "string",
-                    "enum": ["interested", "automated_reply", "not_automated_reply"],
+                    "enum": _REPLY_STATUSES,
                     "description": "Filter by status.",
                 },
                 "folder": {
                     "type": "string",
-                    "enum": ["inbox", "sent", "spam", "bounced", "all"],
+                    "enum": _REPLY_FOLDERS,
                     "description": "Filter by folder.",
                 },
                 "read": {
@@ -2618,12 +2004,12 @@ TOOL_DEFINITIONS: list[types.Tool] = [
                 },
                 "status": {
                     "type": "string",
-                    "enum": ["interested", "automated_reply", "not_automated_reply"],
+                    "enum": _REPLY_STATUSES,
                     "description": "Filter by status.",
                 },
                 "folder": {
                     "type": "string",
-                    "enum": ["inbox", "sent", "spam", "bounced", "all"],
+                    "enum": _REPLY_FOLDERS,
                     "description": "Filter by folder.",
                 },
                 "read": {
@@ -2714,7 +2100,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="M_List_Sender_Emails",
         title="M. List Sender Emails",
         description=(
-            "🚨 REQUIRED FIRST STEP: Retrieve all email accounts (sender emails) associated with the authenticated workspace. "
+            _REQUIRED_FIRST_STEP + "Retrieve all email accounts (sender emails) associated with the authenticated workspace. "
             "MUST be called before using any sender_email_id in other operations. "
             "Returns detailed information including name, email address, email signature, IMAP/SMTP settings, daily limits, type, status, statistics (emails sent, replies, opens, bounces, etc.), and associated tags. "
             "Supports filtering by search term, tag IDs, excluded tag IDs, and accounts without tags. "
@@ -2829,7 +2215,8 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="M. Send Email",
         description=(
             "Send a single ad-hoc email from a sender account. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call M_List_Sender_Emails to get the email_account_id."
+            + _REQUIRED_FIRST_STEP
+            + "You MUST first call M_List_Sender_Emails to get the email_account_id."
         ),
         inputSchema={
             "type": "object",
@@ -2934,8 +2321,8 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="W. Get Workspace Details",
         description=(
             "Retrieve the details of a specific workspace for the authenticated user. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call W_List_Workspaces to find the workspace and get its team_id. "
-            "Returns comprehensive information including workspace ID, name, personal_team flag, main flag, parent_id, email verification credits (total monthly, remaining monthly, remaining, total), sender email limit, warmup limit, warmup filter phrase, sender email limit disabled flag, access flags (has_access_to_warmup, has_access_to_healthcheck), and timestamps (created_at, updated_at)."
+            + _first_step("W_List_Workspaces", "find the workspace and get its team_id")
+            + "Returns comprehensive information including workspace ID, name, personal_team flag, main flag, parent_id, email verification credits (total monthly, remaining monthly, remaining, total), sender email limit, warmup limit, warmup filter phrase, sender email limit disabled flag, access flags (has_access_to_warmup, has_access_to_healthcheck), and timestamps (created_at, updated_at)."
         ),
         inputSchema={
             "type": "object",
@@ -3044,8 +2431,8 @@ TOOL_DEFINITIONS: list[types.Tool] = [
             "Instead, use the `client_name` parameter in other tools (e.g., `client_name=\"ATI\"` or `client_name=\"LongRun\"`). "
             "This tool is only for switching workspaces within a single account's API key context. "
             "Switch to a different workspace for the authenticated user. This operation changes the active workspace context. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call W_List_Workspaces to find the workspace and get its team_id. "
-            "Returns the name of the workspace that was switched to."
+            + _first_step("W_List_Workspaces", "find the workspace and get its team_id")
+            + "Returns the name of the workspace that was switched to."
         ),
         inputSchema={
             "type": "object",
@@ -3064,8 +2451,8 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         title="W. Update Workspace",
         description=(
             "Update workspace information for the authenticated user, specifically the workspace name. "
-            "🚨 REQUIRED FIRST STEP: You MUST first call W_List_Workspaces to find the workspace and get its team_id. "
-            "Returns the updated workspace name."
+            + _first_step("W_List_Workspaces", "find the workspace and get its team_id")
+            + "Returns the updated workspace name."
         ),
         inputSchema={
             "type": "object",
@@ -3217,7 +2604,7 @@ TOOL_DEFINITIONS: list[types.Tool] = [
         name="T_List_Tags",
         title="T. List Tags",
         description=(
-            "🚨 REQUIRED FIRST STEP: Retrieve all tags in the current workspace. "
+            _REQUIRED_FIRST_STEP + "Retrieve all tags in the current workspace. "
             "MUST be called before filtering leads, campaigns, or sender emails by tags. "
             "Returns tag IDs that are required for filtering (the API does not accept tag names). "
             "Use the returned tag IDs in tag_ids parameters when filtering."
@@ -3306,10 +2693,10 @@ TOOL_DEFINITIONS: list[types.Tool] = [
             "additionalProperties": False,
         },
     )
-]
+)
 
 
-def _add_client_name_to_tool_schemas(tools: list[types.Tool]) -> None:
+def _add_client_name_to_tool_schemas(tools: Iterable[types.Tool]) -> None:
     """Add client_name parameter to all tool input schemas."""
     client_name_property = {
         "client_name": {
@@ -3335,25 +2722,55 @@ def _add_client_name_to_tool_schemas(tools: list[types.Tool]) -> None:
 # Add client_name parameter to all tool definitions
 _add_client_name_to_tool_schemas(TOOL_DEFINITIONS)
 
+# Tool, resource and prompt listings are fixed once the module is loaded, so the
+# list handlers hand back these prebuilt results instead of rebuilding them.
+_LIST_TOOLS_RESULT = types.ListToolsResult(tools=list(TOOL_DEFINITIONS))
+_LIST_RESOURCES_RESULT = types.ListResourcesResult(resources=RESOURCES)
+_LIST_PROMPTS_RESULT = types.ListPromptsResult(prompts=list(PROMPT_DEFINITIONS.values()))
+
+_TOOLS_BY_NAME: Mapping[str, types.Tool] = MappingProxyType({tool.name: tool for tool in TOOL_DEFINITIONS})
+
+
+# Input schemas are validated in call_tool rather than by the SDK dispatcher, which
+# would run ``jsonschema.validate`` (schema check included) on every tool call.
+# Validators are built on a tool's first call: checking or compiling all of the
+# schemas up front would dominate the module's import time.
+_INPUT_SCHEMA_DIALECT = "http://json-schema.org/draft-07/schema#"
+
+
+@lru_cache(maxsize=None)
+def _input_validator(tool_name: str) -> Callable[[Any], Any]:
+    """Return a reusable validator for a tool's input schema.
+
+    fastjsonschema turns the schema into plain Python code when it is installed;
+    otherwise a jsonschema validator is checked once and kept for reuse, which
+    still avoids re-checking the schema on every call like ``jsonschema.validate``.
+    Both paths use draft 7 and treat ``format`` as an annotation, as jsonschema
+    does by default, so the accepted inputs do not depend on what is installed.
+    """
+    schema = {"$schema": _INPUT_SCHEMA_DIALECT, **_TOOLS_BY_NAME[tool_name].inputSchema}
+    if fastjsonschema is not None:
+        try:
+            return fastjsonschema.compile(schema, use_default=False, use_formats=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            pass
+    jsonschema.Draft7Validator.check_schema(schema)
+    return jsonschema.Draft7Validator(schema).validate
+
+
+_INPUT_VALIDATION_ERRORS: tuple[type[Exception], ...] = (jsonschema.ValidationError,)
+if fastjsonschema is not None:
+    _INPUT_VALIDATION_ERRORS += (fastjsonschema.JsonSchemaValueException,)
+
 
 @server.list_tools()
 async def list_tools(_req: types.ListToolsRequest | None = None) -> types.ListToolsResult:
-    return types.ListToolsResult(tools=TOOL_DEFINITIONS)
+    return _LIST_TOOLS_RESULT
 
 
 @server.list_resources()
 async def list_resources(_req: types.ListResourcesRequest | None = None) -> types.ListResourcesResult:
-    resources = [
-        types.Resource(
-            name=info["name"],
-            uri=info["uri"],
-            description=info["description"],
-            mimeType=info["mime_type"],
-            title=info["title"],
-        )
-        for info in RESOURCE_DEFINITIONS.values()
-    ]
-    return types.ListResourcesResult(resources=resources)
+    return _LIST_RESOURCES_RESULT
 
 
 @server.read_resource()
@@ -3361,18 +2778,13 @@ async def read_resource(uri: str):
     info = RESOURCE_DEFINITIONS_BY_URI.get(str(uri))
     if not info:
         raise ValueError(f"Unknown resource URI: {uri}")
-    return [
-        types.TextResourceContents(
-            uri=info["uri"],
-            text=info["content"],
-            mimeType=info["mime_type"],
-        )
-    ]
+    # The loader caches the decoded text, so repeat reads reuse the same str
+    return [ReadResourceContents(content=info["content_loader"](), mime_type=info["mime_type"])]
 
 
 @server.list_prompts()
 async def list_prompts(_req: types.ListPromptsRequest | None = None) -> types.ListPromptsResult:
-    return types.ListPromptsResult(prompts=list(PROMPT_DEFINITIONS.values()))
+    return _LIST_PROMPTS_RESULT
 
 
 @server.get_prompt()
@@ -3400,7 +2812,7 @@ def _as_list(value: Any) -> list[str]:
 
 def _get_client_manager() -> ClientManager:
     """Get the ClientManager instance."""
-    client_manager = getattr(server, "client_manager", None)  # type: ignore[attr-defined]
+    client_manager = _current_client_manager.get()
     if client_manager is None:
         raise RuntimeError("ClientManager not initialised.")
     return client_manager
@@ -3459,6 +2871,210 @@ def _flatten_filters(filters: dict[str, Any], prefix: str = "filters") -> dict[s
     return flattened
 
 
+def _arguments_key(arguments: Mapping[str, Any]) -> str | bytes:
+    """Serialise tool arguments into a stable, hashable cache-key component."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                arguments, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(arguments, sort_keys=True, default=str)
+
+
+# Next pages fetched in the background for the paginated tools, so that the
+# follow-up call for page N+1 finds its response already in flight or done.
+_PREFETCH_TTL = 30.0
+_PREFETCH: dict[tuple[Any, ...], tuple[float, asyncio.Task[dict[str, Any]]]] = {}
+
+
+def _prefetch_key(
+    client: EmailBisonClient, tool_name: str, arguments: Mapping[str, Any], page: int
+) -> tuple[Any, ...]:
+    rest = {key: value for key, value in arguments.items() if key != "page"}
+    return (client, tool_name, _arguments_key(rest), page)
+
+
+def _has_next_page(payload: Mapping[str, Any]) -> bool:
+    links = payload.get("links") or {}
+    meta = payload.get("meta") or {}
+    current_page = meta.get("current_page") or 1
+    last_page = meta.get("last_page") or 1
+    return links.get("next") is not None or current_page < last_page
+
+
+# Page size used for all_pages requests that do not set per_page, so the rows
+# arrive in a few large pages rather than many of the API's default 15.
+_ALL_PAGES_PER_PAGE = 100
+
+
+def _page_size(arguments: Mapping[str, Any], default: int) -> int:
+    """Return the per_page for a list call, enlarging it for ``all_pages`` fetches."""
+    per_page = arguments.get("per_page")
+    if per_page:
+        return int(per_page)
+    return _ALL_PAGES_PER_PAGE if arguments.get("all_pages") else default
+
+
+async def _fetch_pages(
+    tool_name: str,
+    client: EmailBisonClient,
+    arguments: Mapping[str, Any],
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+    *,
+    per_page: int,
+) -> dict[str, Any]:
+    """Fetch the requested page, or every page concurrently when ``all_pages`` is set.
+
+    After a single page is returned, the next one is prefetched in the background
+    and handed to the matching follow-up call if it arrives within ``_PREFETCH_TTL``.
+    """
+    if arguments.get("all_pages"):
+        return await gather_pages(fetch_page, per_page=per_page)
+
+    now = asyncio.get_running_loop().time()
+    for key, (expires, task) in list(_PREFETCH.items()):
+        if expires <= now:
+            del _PREFETCH[key]
+            task.cancel()
+
+    page = int(arguments.get("page") or 1)
+    prefetched = _PREFETCH.pop(_prefetch_key(client, tool_name, arguments, page), None)
+    payload: dict[str, Any] | None = None
+    if prefetched is not None:
+        task = prefetched[1]
+        try:
+            # Shielded so cancelling this call does not look like a cancelled prefetch
+            payload = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            payload = None  # prefetch was invalidated; fetch afresh below
+        except Exception:
+            payload = None  # fall back to a fresh request below
+    if payload is None:
+        payload = await fetch_page(page)
+
+    if isinstance(payload, Mapping) and _has_next_page(payload):
+        next_key = _prefetch_key(client, tool_name, arguments, page + 1)
+        if next_key not in _PREFETCH:
+            task = asyncio.ensure_future(fetch_page(page + 1))
+            # Mark a failure as retrieved so an unused prefetch does not log noise
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            _PREFETCH[next_key] = (now + _PREFETCH_TTL, task)
+    return payload
+
+
+# Short-lived cache for the entity listings the resources tell the model to
+# fetch before almost every operation. Entries (and pending page prefetches) are
+# per client and dropped as soon as that client runs any tool that is not a
+# List/Get call.
+_CACHEABLE_TOOLS = frozenset(
+    {
+        "T_List_Tags",
+        "C_List_Schedule_Timezones",
+        "C_List_Schedule_Templates",
+        "W_List_Custom_Variables",
+        "M_List_Sender_Emails",
+    }
+)
+_RESPONSE_CACHE_TTL = 60.0
+_RESPONSE_CACHE_MAXSIZE = 512
+_RESPONSE_CACHE: OrderedDict[tuple[Any, ...], tuple[float, Any]] = OrderedDict()
+# Requests for cacheable tools that are still running, so identical concurrent
+# calls share one upstream request.
+_INFLIGHT: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+
+
+# Tools whose verb segment (e.g. the "List" in "T_List_Tags") marks them as reads
+_READ_ONLY_TOOLS = frozenset(
+    name for name in _TOOLS_BY_NAME if name.split("_", 2)[1:2] in (["List"], ["Get"])
+)
+
+
+def _is_read_only_tool(tool_name: str) -> bool:
+    return tool_name in _READ_ONLY_TOOLS
+
+
+def _invalidate_response_cache(client: EmailBisonClient) -> None:
+    for key in [key for key in _RESPONSE_CACHE if key[0] is client]:
+        del _RESPONSE_CACHE[key]
+    # Let running requests finish for their callers, but do not hand them to new ones
+    for key in [key for key in _INFLIGHT if key[0] is client]:
+        del _INFLIGHT[key]
+    # Prefetched pages may predate the write (or workspace switch); nobody awaits them yet
+    for key in [key for key in _PREFETCH if key[0] is client]:
+        _PREFETCH.pop(key)[1].cancel()
+
+
+async def _cancel_background_requests(clients: Iterable[EmailBisonClient]) -> None:
+    """Cancel and await the prefetches and shared in-flight requests of ``clients``.
+
+    Their cached listings are dropped too, so no module-level state keeps using a
+    client once its connection pool has been closed.
+    """
+    clients = set(clients)
+    tasks: list[asyncio.Task[Any]] = []
+    for key in [key for key in _PREFETCH if key[0] in clients]:
+        tasks.append(_PREFETCH.pop(key)[1])
+    for key in [key for key in _INFLIGHT if key[0] in clients]:
+        tasks.append(_INFLIGHT.pop(key))
+    for key in [key for key in _RESPONSE_CACHE if key[0] in clients]:
+        del _RESPONSE_CACHE[key]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _cached_response(
+    client: EmailBisonClient,
+    tool_name: str,
+    arguments: Mapping[str, Any],
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Return ``fetch()``'s payload, reusing a cached one for up to ``_RESPONSE_CACHE_TTL`` seconds.
+
+    Concurrent calls with the same key await a single in-flight request. Every
+    caller gets its own deep copy, so mutating a result cannot alter the cache.
+    Tools missing from ``_CACHEABLE_TOOLS`` are always fetched directly.
+    """
+    if tool_name not in _CACHEABLE_TOOLS:
+        return await fetch()
+    key = (client, tool_name, _arguments_key(arguments))
+    now = asyncio.get_running_loop().time()
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            _RESPONSE_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[1])
+        del _RESPONSE_CACHE[key]
+
+    task = _INFLIGHT.get(key)
+    if task is None:
+
+        async def fetch_and_store() -> Any:
+            payload = await fetch()
+            # An invalidation while the request ran removed it from _INFLIGHT; the
+            # payload may predate that write, so hand it to the waiters uncached.
+            if _INFLIGHT.get(key) is asyncio.current_task():
+                _RESPONSE_CACHE[key] = (asyncio.get_running_loop().time() + _RESPONSE_CACHE_TTL, payload)
+                if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+                    _RESPONSE_CACHE.popitem(last=False)
+            return payload
+
+        task = asyncio.ensure_future(fetch_and_store())
+        _INFLIGHT[key] = task
+
+        def _done(finished: asyncio.Task[Any], key: tuple[Any, ...] = key) -> None:
+            if _INFLIGHT.get(key) is finished:
+                del _INFLIGHT[key]
+
+        task.add_done_callback(_done)
+    # Shielded so one caller's cancellation does not fail the others sharing the task
+    return copy.deepcopy(await asyncio.shield(task))
+
+
 def _pagination_reminder(payload: dict[str, Any]) -> str:
     """Generate a pagination reminder message based on the response payload."""
     links = payload.get("links", {})
@@ -3552,14 +3168,28 @@ def _pagination_reminder(payload: dict[str, Any]) -> str:
     return "\n".join(reminder_parts)
 
 
-@server.call_tool()
+@server.call_tool(validate_input=False)
 async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallToolResult | tuple[Any, Any]:
+    if tool_name not in _TOOLS_BY_NAME:
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=f"Unknown tool: {tool_name}")],
+            isError=True,
+        )
+    try:
+        _input_validator(tool_name)(arguments)
+    except _INPUT_VALIDATION_ERRORS as exc:
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=f"Input validation error: {exc.message}")],
+            isError=True,
+        )
     # Extract client_name from arguments if provided (create copy to avoid modifying original)
     arguments_copy = dict(arguments)
     client_name = arguments_copy.pop("client_name", None)
     client = _get_client_for_account(client_name)
     # Use the copy (without client_name) for the rest of the function
     arguments = arguments_copy
+    if not _is_read_only_tool(tool_name):
+        _invalidate_response_cache(client)
     try:
         if tool_name == "L_List_Leads":
             filters = _extract_filters(arguments, exclude={"search", "status", "page", "per_page", "interested"})
@@ -3568,20 +3198,33 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
                 if not filters:
                     filters = {}
                 filters["tag_ids"] = arguments.get("tag_ids")
-            response = await client.list_leads(
-                search=arguments.get("search"),
-                status=arguments.get("status"),
-                page=int(arguments.get("page") or 1),
-                per_page=int(arguments.get("per_page") or 50),
-                interested=arguments.get("interested"),
-                filters=filters or None,
+            per_page = _page_size(arguments, 50)
+            payload = await _fetch_pages(
+                "L_List_Leads",
+                client,
+                arguments,
+                lambda page: client.list_leads_raw(
+                    search=arguments.get("search"),
+                    status=arguments.get("status"),
+                    page=page,
+                    per_page=per_page,
+                    interested=arguments.get("interested"),
+                    filters=filters or None,
+                ),
+                per_page=per_page,
             )
-            payload = response.model_dump(by_alias=True)
             pagination_reminder = _pagination_reminder(payload)
             response_text = _json(payload) + pagination_reminder
+            # Structured output must match the tool's outputSchema (data/page/perPage/total)
+            structured = {
+                "data": payload.get("data", []),
+                "page": payload.get("page", 1),
+                "perPage": payload.get("perPage", payload.get("per_page", 50)),
+                "total": payload.get("total", 0),
+            }
             return (
                 [types.TextContent(type="text", text=response_text)],
-                payload,
+                structured,
             )
 
         if tool_name == "L_Create_Lead":
@@ -3660,12 +3303,19 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
                 if not filters:
                     filters = {}
                 filters["tag_ids"] = arguments.get("tag_ids")
-            payload = await client.list_campaigns(
-                search=arguments.get("search"),
-                status=arguments.get("status"),
-                page=int(arguments.get("page") or 1),
-                per_page=int(arguments.get("per_page") or 50),
-                filters=filters or None,
+            per_page = _page_size(arguments, 50)
+            payload = await _fetch_pages(
+                "C_List_Campaigns",
+                client,
+                arguments,
+                lambda page: client.list_campaigns(
+                    search=arguments.get("search"),
+                    status=arguments.get("status"),
+                    page=page,
+                    per_page=per_page,
+                    filters=filters or None,
+                ),
+                per_page=per_page,
             )
             pagination_reminder = _pagination_reminder(payload)
             response_text = _json(payload) + pagination_reminder
@@ -3708,7 +3358,7 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
             )
 
         if tool_name == "T_List_Tags":
-            payload = await client.list_tags()
+            payload = await _cached_response(client, tool_name, arguments, client.list_tags)
             notice = (
                 "Always use tag IDs when filtering leads. For example, supply `tag_ids: [<tag_id>]` instead of names."
             )
@@ -3721,7 +3371,7 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
             )
 
         if tool_name == "W_List_Custom_Variables":
-            payload = await client.list_custom_variables()
+            payload = await _cached_response(client, tool_name, arguments, client.list_custom_variables)
             return (
                 [types.TextContent(type="text", text=_json(payload))],
                 payload,
@@ -4010,14 +3660,14 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
             )
 
         if tool_name == "C_List_Schedule_Templates":
-            payload = await client.list_schedule_templates()
+            payload = await _cached_response(client, tool_name, arguments, client.list_schedule_templates)
             return (
                 [types.TextContent(type="text", text=_json(payload))],
                 payload,
             )
 
         if tool_name == "C_List_Schedule_Timezones":
-            payload = await client.list_schedule_timezones()
+            payload = await _cached_response(client, tool_name, arguments, client.list_schedule_timezones)
             notice = (
                 "Use the timezone 'id' field (e.g., 'America/New_York') when creating or updating campaign schedules. "
                 "Do not use the 'name' field."
@@ -4203,8 +3853,7 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
 
         if tool_name == "C_Get_Campaign_Replies":
             campaign_id = int(_require(arguments, "campaign_id"))
-            page = int(arguments.get("page", 1))
-            per_page = int(arguments.get("per_page", 15))
+            per_page = _page_size(arguments, 15)
             search = arguments.get("search")
             status = arguments.get("status")
             folder = arguments.get("folder")
@@ -4217,18 +3866,24 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
             # Move all filter parameters into filters object
             if tag_ids and "tag_ids" not in filters:
                 filters["tag_ids"] = [int(tid) for tid in tag_ids] if isinstance(tag_ids, list) else tag_ids
-            payload = await client.get_campaign_replies(
-                campaign_id,
-                search=search,
-                status=status,
-                folder=folder,
-                read=bool(read) if read is not None else None,
-                sender_email_id=int(sender_email_id) if sender_email_id is not None else None,
-                lead_id=int(lead_id) if lead_id is not None else None,
-                query_campaign_id=int(query_campaign_id) if query_campaign_id is not None else None,
-                page=page,
+            payload = await _fetch_pages(
+                "C_Get_Campaign_Replies",
+                client,
+                arguments,
+                lambda page: client.get_campaign_replies(
+                    campaign_id,
+                    search=search,
+                    status=status,
+                    folder=folder,
+                    read=bool(read) if read is not None else None,
+                    sender_email_id=int(sender_email_id) if sender_email_id is not None else None,
+                    lead_id=int(lead_id) if lead_id is not None else None,
+                    query_campaign_id=int(query_campaign_id) if query_campaign_id is not None else None,
+                    page=page,
+                    per_page=per_page,
+                    filters=filters if filters else None,
+                ),
                 per_page=per_page,
-                filters=filters if filters else None,
             )
             pagination_reminder = _pagination_reminder(payload)
             response_text = _json(payload) + pagination_reminder
@@ -4239,16 +3894,21 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
 
         if tool_name == "C_Get_Campaign_Leads":
             campaign_id = int(_require(arguments, "campaign_id"))
-            page = int(arguments.get("page", 1))
-            per_page = int(arguments.get("per_page", 15))
+            per_page = _page_size(arguments, 15)
             search = arguments.get("search")
             filters = arguments.get("filters")
-            payload = await client.get_campaign_leads(
-                campaign_id,
-                search=search,
-                page=page,
+            payload = await _fetch_pages(
+                "C_Get_Campaign_Leads",
+                client,
+                arguments,
+                lambda page: client.get_campaign_leads(
+                    campaign_id,
+                    search=search,
+                    page=page,
+                    per_page=per_page,
+                    filters=filters,
+                ),
                 per_page=per_page,
-                filters=filters,
             )
             pagination_reminder = _pagination_reminder(payload)
             response_text = _json(payload) + pagination_reminder
@@ -4560,9 +4220,14 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> types.CallTool
                 filters["excluded_tag_ids"] = [int(tid) for tid in excluded_tag_ids] if isinstance(excluded_tag_ids, list) else excluded_tag_ids
             if without_tags is not None and "without_tags" not in filters:
                 filters["without_tags"] = without_tags
-            payload = await client.list_sender_emails(
-                search=search,
-                filters=filters if filters else None,
+            payload = await _cached_response(
+                client,
+                tool_name,
+                arguments,
+                lambda: client.list_sender_emails(
+                    search=search,
+                    filters=filters if filters else None,
+                ),
             )
             return (
                 [types.TextContent(type="text", text=_json(payload))],
@@ -4758,7 +4423,7 @@ async def _run() -> None:
 
 
 def main() -> None:
-    anyio.run(_run)
+    anyio.run(_run, backend_options={"use_uvloop": _UVLOOP_AVAILABLE})
 
 
 if __name__ == "__main__":